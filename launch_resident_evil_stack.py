@@ -172,7 +172,7 @@ def restore_stack() -> int:
 
 
 def inspect_state() -> int:
-    displays = enumerate_attached_displays()
+    displays = enumerate_attached_displays(with_monitors=True)
     if not displays:
         print("[re-stack] No attached displays found or display API unavailable.")
     else:
@@ -142,12 +142,14 @@ def main() -> int:
     )
 
     # --- Load primary profile ---
-    try:
-        with open(manifest.primary.profile, "r", encoding="utf-8-sig") as f:
-            primary_profile = json.load(f)
-    except Exception as exc:
-        print(f"[session] Cannot read primary profile: {exc}")
-        return 1
+    primary_profile = manifest.primary.data
+    if not primary_profile:
+        try:
+            with open(manifest.primary.profile, "r", encoding="utf-8-sig") as f:
+                primary_profile = json.load(f)
+        except Exception as exc:
+            print(f"[session] Cannot read primary profile: {exc}")
+            return 1
 
     exe = primary_profile.get("path", "")
     cwd = primary_profile.get("dir", os.path.dirname(exe) if exe else "")
@@ -207,6 +209,11 @@ def main() -> int:
             cfg.get("launcher_integration", {}).get("poll_seconds", 0.5)
         )
         watch_paths = [entry.profile for entry in manifest.watch]
+        profile_data = {
+            entry.profile: entry.data
+            for entry in (manifest.primary, *manifest.watch)
+            if entry.data
+        }
 
         watcher.run(
             proc=proc,
@@ -215,6 +222,7 @@ def main() -> int:
             restore_rect=restore_rect,
             poll_seconds=poll_seconds,
             debug=args.debug,
+            profile_data=profile_data,
         )
 
     finally:
@@ -1,10 +1,15 @@
 import datetime as dt
 import argparse
+import hashlib
+import io
+import json
+import mmap
 import os
 import shutil
 import sys
 import xml.etree.ElementTree as ET
 import re
+from typing import Dict, List, Optional, Tuple
 
 
 LAUNCHBOX_EMULATORS = r"D:\Emulators\LaunchBox\Data\Emulators.xml"
@@ -22,6 +27,10 @@ WRAPPER_RETRO = os.path.join(PROJECT_ROOT, "integrations", "launchbox", "wrapper
 WRAPPER_PPSSPP = os.path.join(PROJECT_ROOT, "integrations", "launchbox", "wrapper", "launchbox_ppsspp_wrapper.bat")
 WRAPPER_DOLPHIN = os.path.join(PROJECT_ROOT, "integrations", "launchbox", "wrapper", "launchbox_dolphin_wrapper.bat")
 WRAPPER_PCSX2 = os.path.join(PROJECT_ROOT, "integrations", "launchbox", "wrapper", "launchbox_pcsx2_wrapper.bat")
+WRAPPER_DIR = os.path.dirname(WRAPPER_RETRO)
+
+# (wrapper dir mtime_ns, missing wrapper list) from the last presence check.
+_last_wrapper_check: Tuple[Optional[int], List[str]] = (None, [])
 
 
 def backup_file(path: str) -> str:
@@ -33,49 +42,113 @@ def backup_file(path: str) -> str:
     return backup_path
 
 
+_WRAPPERS: Dict[str, str] = {
+    RETRO_TITLE: RELATIVE_WRAPPER,
+    PPSSPP_TITLE: RELATIVE_PPSSPP_WRAPPER,
+    DOLPHIN_TITLE: RELATIVE_DOLPHIN_WRAPPER,
+    PCSX2_TITLE: RELATIVE_PCSX2_WRAPPER,
+}
+
+
+def _set_child_text(parent: ET.Element, tag: str, value: str) -> bool:
+    """Set a child element's text, creating it if needed. Returns True if changed."""
+    child = parent.find(tag)
+    if child is None:
+        child = ET.SubElement(parent, tag)
+    if child.text != value:
+        child.text = value
+        return True
+    return False
+
+
+_STAMP_SUFFIX = ".wrapper_install.stamp"
+_WRAPPERS_DIGEST = hashlib.sha256(
+    json.dumps(_WRAPPERS, sort_keys=True).encode("utf-8")
+).hexdigest()
+
+
+def _parse_tree_mmap(path: str) -> ET.ElementTree:
+    """Parse an XML file by feeding expat straight from a read-only mmap.
+
+    Avoids the intermediate read buffer ET.parse() allocates; falls back to
+    ET.parse() for files mmap cannot map (e.g. empty files).
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return ET.parse(path)
+        try:
+            parser = ET.XMLParser()
+            parser.feed(mm)
+            return ET.ElementTree(parser.close())
+        finally:
+            mm.close()
+
+
+def _write_tree_atomic(tree: ET.ElementTree, path: str) -> None:
+    """Serialize `tree` in memory, then replace `path` in one write.
+
+    A crash mid-write leaves the original file intact instead of a truncated
+    Emulators.xml.
+    """
+    buf = io.BytesIO()
+    tree.write(buf, encoding="utf-8", xml_declaration=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf.getvalue())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _stamp_matches(path: str, st: os.stat_result) -> bool:
+    """Return True if the sidecar stamp says `path` is already patched as-is."""
+    try:
+        with open(path + _STAMP_SUFFIX, "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return (
+        stamp.get("mtime_ns") == st.st_mtime_ns
+        and stamp.get("size") == st.st_size
+        and stamp.get("wrappers") == _WRAPPERS_DIGEST
+    )
+
+
+def _write_stamp(path: str) -> None:
+    st = os.stat(path)
+    stamp_path = path + _STAMP_SUFFIX
+    tmp = stamp_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "wrappers": _WRAPPERS_DIGEST},
+            f,
+        )
+    os.replace(tmp, stamp_path)
+
+
 def patch_emulators(path: str) -> bool:
-    tree = ET.parse(path)
+    tree = _parse_tree_mmap(path)
     root = tree.getroot()
 
     changed = False
-    retro_id = None
-    ppsspp_id = None
-    dolphin_id = None
-    pcsx2_id = None
+    ids: Dict[str, str] = {}
     for emulator in root.findall("Emulator"):
-        title = (emulator.findtext("Title") or "").strip().lower()
-        if title == RETRO_TITLE:
-            retro_id = (emulator.findtext("ID") or "").strip()
-            app_path = emulator.find("ApplicationPath")
-            if app_path is None:
-                app_path = ET.SubElement(emulator, "ApplicationPath")
-            if app_path.text != RELATIVE_WRAPPER:
-                app_path.text = RELATIVE_WRAPPER
-                changed = True
-        elif title == PPSSPP_TITLE:
-            ppsspp_id = (emulator.findtext("ID") or "").strip()
-            app_path = emulator.find("ApplicationPath")
-            if app_path is None:
-                app_path = ET.SubElement(emulator, "ApplicationPath")
-            if app_path.text != RELATIVE_PPSSPP_WRAPPER:
-                app_path.text = RELATIVE_PPSSPP_WRAPPER
-                changed = True
-        elif title == DOLPHIN_TITLE:
-            dolphin_id = (emulator.findtext("ID") or "").strip()
-            app_path = emulator.find("ApplicationPath")
-            if app_path is None:
-                app_path = ET.SubElement(emulator, "ApplicationPath")
-            if app_path.text != RELATIVE_DOLPHIN_WRAPPER:
-                app_path.text = RELATIVE_DOLPHIN_WRAPPER
-                changed = True
-        elif title == PCSX2_TITLE:
-            pcsx2_id = (emulator.findtext("ID") or "").strip()
-            app_path = emulator.find("ApplicationPath")
-            if app_path is None:
-                app_path = ET.SubElement(emulator, "ApplicationPath")
-            if app_path.text != RELATIVE_PCSX2_WRAPPER:
-                app_path.text = RELATIVE_PCSX2_WRAPPER
-                changed = True
+        title = emulator.findtext("Title")
+        if not title:
+            continue
+        title = title.strip().lower()
+        wrapper = _WRAPPERS.get(title)
+        if wrapper is None:
+            continue
+        ids[title] = (emulator.findtext("ID") or "").strip()
+        changed |= _set_child_text(emulator, "ApplicationPath", wrapper)
+
+    retro_id = ids.get(RETRO_TITLE)
+    ppsspp_id = ids.get(PPSSPP_TITLE)
+    dolphin_id = ids.get(DOLPHIN_TITLE)
+    pcsx2_id = ids.get(PCSX2_TITLE)
 
     if retro_id:
         for platform in root.findall("EmulatorPlatform"):
@@ -130,10 +203,34 @@ def patch_emulators(path: str) -> bool:
                 changed = True
 
     if changed:
-        tree.write(path, encoding="utf-8", xml_declaration=True)
+        _write_tree_atomic(tree, path)
     return changed
 
 
+def missing_wrappers() -> List[str]:
+    """Return wrapper .bat paths that do not exist.
+
+    The per-file check is skipped when the wrapper directory's mtime (which
+    changes whenever an entry is added, removed or renamed) matches the last
+    check made in this process.
+    """
+    global _last_wrapper_check
+    cur: Optional[int]
+    try:
+        cur = os.stat(WRAPPER_DIR).st_mtime_ns
+    except OSError:
+        cur = None
+    if cur is not None and _last_wrapper_check[0] == cur:
+        return list(_last_wrapper_check[1])
+    missing: List[str] = [
+        p
+        for p in (WRAPPER_RETRO, WRAPPER_PPSSPP, WRAPPER_DOLPHIN, WRAPPER_PCSX2)
+        if not os.path.exists(p)
+    ]
+    _last_wrapper_check = (cur, missing)
+    return list(missing)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Install/verify LaunchBox wrapper integration."
@@ -146,11 +243,7 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    missing = [
-        p
-        for p in (WRAPPER_RETRO, WRAPPER_PPSSPP, WRAPPER_DOLPHIN, WRAPPER_PCSX2)
-        if not os.path.exists(p)
-    ]
+    missing = missing_wrappers()
     if missing:
         print("Missing wrapper file(s):")
         for path in missing:
@@ -172,10 +265,21 @@ def main() -> int:
         print(f"LaunchBox Emulators.xml not found: {LAUNCHBOX_EMULATORS}")
         return 1
 
+    # Skip the backup and the parse when the file is byte-for-byte what our
+    # last patch left behind (same mtime/size and same wrapper targets).
+    if _stamp_matches(LAUNCHBOX_EMULATORS, os.stat(LAUNCHBOX_EMULATORS)):
+        print("No changes needed; wrapper already configured.")
+        return 0
+
     backup = backup_file(LAUNCHBOX_EMULATORS)
     changed = patch_emulators(LAUNCHBOX_EMULATORS)
 
     print(f"Backup: {backup}")
+    # Stamp after any successful run: a no-op pass has just verified the file.
+    try:
+        _write_stamp(LAUNCHBOX_EMULATORS)
+    except OSError as exc:
+        print(f"Warning: could not write patch stamp: {exc}")
     if changed:
         print("Patched RetroArch/PPSSPP/Dolphin/PCSX2 emulators to use wrappers.")
     else:
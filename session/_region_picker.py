@@ -9,10 +9,34 @@ Prints a JSON result to stdout on success, nothing on cancel.
 Exit code 0 = success, 1 = cancel/error.
 """
 
+import ctypes
+import ctypes.wintypes
 import json
 import logging
 import sys
 
+# ---- ctypes window APIs (bound once; avoids pywin32 import in the picker) ----
+
+_GA_ROOT = 2
+_HWND_TOPMOST = -1
+_SWP_SHOWWINDOW = 0x0040
+
+if sys.platform == "win32":
+    _GetAncestor = ctypes.windll.user32.GetAncestor
+    _GetAncestor.argtypes = [ctypes.wintypes.HWND, ctypes.c_uint]
+    _GetAncestor.restype = ctypes.wintypes.HWND
+
+    _SetWindowPos = ctypes.windll.user32.SetWindowPos
+    _SetWindowPos.argtypes = [
+        ctypes.wintypes.HWND, ctypes.wintypes.HWND,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.c_uint,
+    ]
+    _SetWindowPos.restype = ctypes.wintypes.BOOL
+else:
+    _GetAncestor = None
+    _SetWindowPos = None
+
 
 def _setup_log(log_path: str) -> logging.Logger:
     log = logging.getLogger("picker")
@@ -65,20 +89,18 @@ def main() -> int:
         # Belt-and-suspenders: also reposition via Win32 in case the geometry
         # string doesn't handle negative virtual-desktop coords on this system.
         try:
-            import ctypes
-            import win32con
-            import win32gui
+            if _GetAncestor is None:
+                raise RuntimeError("not running on Windows")
             root.update()  # ensure HWND exists
             frame_hwnd = root.winfo_id()
             log.info("frame hwnd=0x%x", frame_hwnd)
-            _GA_ROOT = 2
-            top_hwnd = ctypes.windll.user32.GetAncestor(frame_hwnd, _GA_ROOT)
-            log.info("top hwnd=0x%x", top_hwnd)
+            top_hwnd = _GetAncestor(frame_hwnd, _GA_ROOT)
+            log.info("top hwnd=0x%x", top_hwnd or 0)
             if top_hwnd:
-                rc = win32gui.SetWindowPos(
-                    top_hwnd, win32con.HWND_TOPMOST,
+                rc = _SetWindowPos(
+                    top_hwnd, _HWND_TOPMOST,
                     ml, mt, mw, mh,
-                    win32con.SWP_SHOWWINDOW,
+                    _SWP_SHOWWINDOW,
                 )
                 log.info("SetWindowPos rc=%s", rc)
             else:
@@ -102,6 +124,15 @@ def main() -> int:
 
         sx = sy = 0
         rect_id = [None]
+        # Motion events can arrive at the mouse poll rate (up to 1000 Hz);
+        # coalesce them and redraw at most once per ~16 ms frame.
+        drag_pos = [0, 0]
+        drag_pending = [False]
+
+        def flush_drag():
+            drag_pending[0] = False
+            if rect_id[0]:
+                canvas.coords(rect_id[0], sx, sy, drag_pos[0], drag_pos[1])
 
         def on_press(e):
             nonlocal sx, sy
@@ -111,10 +142,14 @@ def main() -> int:
             rect_id[0] = canvas.create_rectangle(sx, sy, sx, sy, outline="cyan", width=2)
 
         def on_drag(e):
-            if rect_id[0]:
-                canvas.coords(rect_id[0], sx, sy, e.x, e.y)
+            drag_pos[0], drag_pos[1] = e.x, e.y
+            if not drag_pending[0]:
+                drag_pending[0] = True
+                root.after(16, flush_drag)
 
         def on_release(e):
+            drag_pos[0], drag_pos[1] = e.x, e.y
+            flush_drag()
             x1, y1 = min(sx, e.x), min(sy, e.y)
             x2, y2 = max(sx, e.x), max(sy, e.y)
             if x2 - x1 <= 10 or y2 - y1 <= 10:
@@ -0,0 +1,105 @@
+"""Lightweight Win32 process enumeration via the ToolHelp snapshot API.
+
+CreateToolhelp32Snapshot returns every process name in one call, with no
+per-process OpenProcess.  Callers filter by name first and only then ask for
+the (more expensive) image path of the few processes they care about.
+
+On non-Windows platforms available() is False and the helpers yield nothing.
+"""
+
+import ctypes
+import ctypes.wintypes
+import sys
+from typing import Iterator, Optional, Tuple
+
+_TH32CS_SNAPPROCESS = 0x00000002
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+_MAX_PATH = 260
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", ctypes.wintypes.DWORD),
+        ("cntUsage", ctypes.wintypes.DWORD),
+        ("th32ProcessID", ctypes.wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.wintypes.DWORD),
+        ("cntThreads", ctypes.wintypes.DWORD),
+        ("th32ParentProcessID", ctypes.wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", ctypes.wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * _MAX_PATH),
+    ]
+
+
+if sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _CreateToolhelp32Snapshot = _kernel32.CreateToolhelp32Snapshot
+    _CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+    _CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+
+    _Process32FirstW = _kernel32.Process32FirstW
+    _Process32FirstW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _Process32FirstW.restype = ctypes.wintypes.BOOL
+
+    _Process32NextW = _kernel32.Process32NextW
+    _Process32NextW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _Process32NextW.restype = ctypes.wintypes.BOOL
+
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD]
+    _OpenProcess.restype = ctypes.wintypes.HANDLE
+
+    _QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+    _QueryFullProcessImageNameW.argtypes = [
+        ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD,
+        ctypes.wintypes.LPWSTR, ctypes.POINTER(ctypes.wintypes.DWORD),
+    ]
+    _QueryFullProcessImageNameW.restype = ctypes.wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    _CloseHandle.restype = ctypes.wintypes.BOOL
+else:
+    _kernel32 = None
+
+
+def available() -> bool:
+    return _kernel32 is not None
+
+
+def iter_process_names() -> Iterator[Tuple[int, str]]:
+    """Yield (pid, exe_name) for every process in one ToolHelp snapshot."""
+    if _kernel32 is None:
+        return
+    snap = _CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if not snap or snap == _INVALID_HANDLE_VALUE:
+        return
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        ok = _Process32FirstW(snap, ctypes.byref(entry))
+        while ok:
+            yield int(entry.th32ProcessID), entry.szExeFile
+            ok = _Process32NextW(snap, ctypes.byref(entry))
+    finally:
+        _CloseHandle(snap)
+
+
+def process_image_path(pid: int) -> Optional[str]:
+    """Return the full executable path for pid, or None if it cannot be read."""
+    if _kernel32 is None:
+        return None
+    handle = _OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        size = ctypes.wintypes.DWORD(32768)
+        buf = ctypes.create_unicode_buffer(size.value)
+        if not _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return None
+        return buf.value
+    finally:
+        _CloseHandle(handle)
@@ -1,15 +1,25 @@
 """Audio switching helpers: PowerShell runner, device selection, tool status."""
 
 import subprocess
+import sys
 from typing import Optional
 
 
 def _run_powershell(script: str, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+    kwargs = {}
+    if sys.platform == "win32":
+        # Hidden, console-less spawn: no window flash during session switches.
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = 0  # SW_HIDE
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        kwargs["startupinfo"] = si
     return subprocess.run(
         ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", script],
         capture_output=True,
         text=True,
         cwd=cwd,
+        **kwargs,
     )
 
 
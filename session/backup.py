@@ -11,14 +11,27 @@ Usage:
 restore_files() never raises.  On a partial failure it prints manual copy
 instructions for each failed file and returns False so the caller can decide
 how to proceed.
+
+The manifest is newline-delimited JSON (one {"original", "backup"} object per
+line) so restore can stream it entry by entry.  Manifests written by older
+versions as a single JSON array are still accepted.
 """
 import json
 import os
 import shutil
 import tempfile
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 
 _MANIFEST = "backup_manifest.json"
+_MAX_COPY_WORKERS = 4
+
+
+def _size_or_zero(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0  # copy2 below reports the real error
 
 
 def backup_files(paths: List[str]) -> str:
@@ -28,17 +41,47 @@ def backup_files(paths: List[str]) -> str:
     The caller must call cleanup() when the backup is no longer needed.
     """
     backup_dir = tempfile.mkdtemp(prefix="crt_session_backup_")
-    entries = []
-    for i, src in enumerate(paths):
-        ext = os.path.splitext(src)[1]
-        dst_name = f"{i:04d}{ext}"
-        shutil.copy2(src, os.path.join(backup_dir, dst_name))
-        entries.append({"original": src, "backup": dst_name})
+    # Backups must be real copies, not hardlinks: the patch handlers rewrite
+    # targets with open(path, "w"), which truncates the same inode and would
+    # clobber a linked backup.  shutil.copy2 already uses the OS fast-copy
+    # path (copy_file_range/sendfile on Linux, CopyFile2 on recent Windows).
+    names = [f"{i:04d}{os.path.splitext(src)[1]}" for i, src in enumerate(paths)]
+    jobs = [(src, os.path.join(backup_dir, name)) for src, name in zip(paths, names)]
+    if len(jobs) > 1:
+        # Largest first so the longest copy is never the one started last.
+        jobs.sort(key=lambda job: _size_or_zero(job[0]), reverse=True)
+        with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(jobs))) as pool:
+            for _ in pool.map(lambda job: shutil.copy2(*job), jobs):
+                pass
+    else:
+        for src, dst in jobs:
+            shutil.copy2(src, dst)
+
     with open(os.path.join(backup_dir, _MANIFEST), "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2)
+        for src, name in zip(paths, names):
+            f.write(json.dumps({"original": src, "backup": name}) + "\n")
     return backup_dir
 
 
+def _iter_manifest(f) -> Iterator[dict]:
+    """Yield manifest entries from an open manifest file.
+
+    Streams JSONL line by line; falls back to json.load() for the legacy
+    single-array format (detected by a leading '[').
+    """
+    first = f.read(1)
+    while first.isspace():
+        first = f.read(1)
+    if first == "[":
+        yield from json.loads(first + f.read())
+        return
+    line = first + f.readline()
+    while line:
+        if line.strip():
+            yield json.loads(line)
+        line = f.readline()
+
+
 def restore_files(backup_dir: str) -> bool:
     """Restore all files to their original locations.
 
@@ -46,25 +89,23 @@ def restore_files(backup_dir: str) -> bool:
     rather than aborting.  Returns True only if every file was restored.
     """
     manifest_path = os.path.join(backup_dir, _MANIFEST)
+    all_ok = True
     try:
         with open(manifest_path, "r", encoding="utf-8") as f:
-            entries = json.load(f)
+            for entry in _iter_manifest(f):
+                src = os.path.join(backup_dir, entry["backup"])
+                dst = entry["original"]
+                try:
+                    shutil.copy2(src, dst)
+                except Exception as exc:
+                    print(f"[backup] RESTORE FAILED: {dst}")
+                    print(f"         Reason  : {exc}")
+                    print(f"         Manual  : copy \"{src}\" \"{dst}\"")
+                    all_ok = False
     except Exception as exc:
         print(f"[backup] Cannot read manifest: {exc}")
         print(f"         Backup directory: {backup_dir}")
         return False
-
-    all_ok = True
-    for entry in entries:
-        src = os.path.join(backup_dir, entry["backup"])
-        dst = entry["original"]
-        try:
-            shutil.copy2(src, dst)
-        except Exception as exc:
-            print(f"[backup] RESTORE FAILED: {dst}")
-            print(f"         Reason  : {exc}")
-            print(f"         Manual  : copy \"{src}\" \"{dst}\"")
-            all_ok = False
     return all_ok
 
 
@@ -1,8 +1,11 @@
 """Windows display API helpers: enumeration, primary switching, refresh rate."""
 
 import ctypes
+import logging
+import sys
+import threading
 import time
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 try:
     import pywintypes
@@ -13,15 +16,89 @@ except Exception:
     win32api = None
     win32con = None
 
+from session.win_events import EventWaiter
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is at emit time.
+
+    launch_resident_evil_stack swaps sys.stdout for a log tee after import;
+    a plain StreamHandler would keep writing to the original stream.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Messages keep the console "[re-stack]" prefix; callers can quiet the
+# chatter with logging.getLogger("restack.display").setLevel(...).
+log = logging.getLogger("restack.display")
+if not log.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter("[re-stack] %(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
 
 # ---------------------------------------------------------------------------
 # Enumeration
 # ---------------------------------------------------------------------------
 
-def enumerate_attached_displays() -> List[dict]:
-    displays: List[dict] = []
+# Display topology rarely changes between the back-to-back lookups made while
+# switching primaries, so enumeration results are reused for a short window.
+# Anything that changes the topology must call invalidate_display_cache().
+# Slots are keyed by with_monitors; a with-monitors result also serves
+# callers that do not need monitor strings.
+_ENUM_CACHE_TTL_S = 0.5
+_enum_cache: dict = {False: (0.0, None), True: (0.0, None)}
+
+
+def invalidate_display_cache() -> None:
+    """Drop cached enumeration results (call after any display topology change)."""
+    _enum_cache[False] = (0.0, None)
+    _enum_cache[True] = (0.0, None)
+    _hz_cache.clear()
+    _primary_cache.clear()
+
+
+def _fresh_cached(with_monitors: bool) -> Optional[List[dict]]:
+    now = time.monotonic()
+    for slot in (True,) if with_monitors else (False, True):
+        t, cached = _enum_cache[slot]
+        if cached is not None and now - t < _ENUM_CACHE_TTL_S:
+            return cached
+    return None
+
+
+def _enum_cached(with_monitors: bool = False) -> List[dict]:
+    cached = _fresh_cached(with_monitors)
+    if cached is not None:
+        return cached
+    now = time.monotonic()
+    displays = list(_iter_attached_displays(with_monitors))
+    _enum_cache[with_monitors] = (now, displays)
+    return displays
+
+
+def enumerate_attached_displays(with_monitors: bool = False) -> List[dict]:
+    """Return attached displays.
+
+    monitor_strings is only populated when with_monitors is True; collecting
+    it costs a second EnumDisplayDevices sweep per adapter.
+    """
+    return list(_enum_cached(with_monitors))
+
+
+def _iter_attached_displays(with_monitors: bool) -> Iterator[dict]:
+    """Yield attached display records one adapter at a time (uncached)."""
     if win32api is None or win32con is None:
-        return displays
+        return
 
     i = 0
     while True:
@@ -34,15 +111,21 @@ def enumerate_attached_displays() -> List[dict]:
         if not (dev.StateFlags & win32con.DISPLAY_DEVICE_ATTACHED_TO_DESKTOP):
             continue
 
+        # Mode fields ride along with the position so rect/mode lookups do
+        # not need a second EnumDisplaySettings call; None if unreadable.
         try:
             dm = win32api.EnumDisplaySettings(dev.DeviceName, win32con.ENUM_CURRENT_SETTINGS)
             pos = (int(dm.Position_x), int(dm.Position_y))
+            width: Optional[int] = int(dm.PelsWidth)
+            height: Optional[int] = int(dm.PelsHeight)
+            hz: Optional[int] = int(dm.DisplayFrequency)
         except Exception:
             pos = (0, 0)
+            width = height = hz = None
 
         monitors: List[str] = []
         j = 0
-        while True:
+        while with_monitors:
             try:
                 mon = win32api.EnumDisplayDevices(dev.DeviceName, j)
             except pywintypes.error:
@@ -51,37 +134,64 @@ def enumerate_attached_displays() -> List[dict]:
             if mon.DeviceString:
                 monitors.append(mon.DeviceString)
 
-        displays.append(
-            {
-                "device_name": dev.DeviceName,
-                "device_string": dev.DeviceString or "",
-                "monitor_strings": monitors,
-                "position": pos,
-                "state_flags": dev.StateFlags,
-            }
-        )
+        yield {
+            "device_name": dev.DeviceName,
+            "device_string": dev.DeviceString or "",
+            "monitor_strings": monitors,
+            "position": pos,
+            "width": width,
+            "height": height,
+            "hz": hz,
+            "state_flags": dev.StateFlags,
+            # Lower-cased names joined once for find_display_by_token.
+            "_search": "\x1f".join(
+                (dev.DeviceName or "", dev.DeviceString or "", *monitors)
+            ).lower(),
+        }
 
-    return displays
+
+def _display_matches_token(d: dict, token: str) -> bool:
+    search = d.get("_search")
+    if search is None:  # caller-built record
+        haystack = [d["device_name"], d["device_string"], *d["monitor_strings"]]
+        return any(token in (item or "").lower() for item in haystack)
+    return token in search
 
 
-def find_display_by_token(name_token: str) -> dict:
+def find_display_by_token(name_token: str, displays: Optional[List[dict]] = None) -> dict:
+    """Return the first attached display whose names contain name_token.
+
+    Pass `displays` (an enumerate_attached_displays(with_monitors=True)
+    snapshot) to resolve several lookups against one enumeration.
+    """
     token = name_token.lower()
-    for d in enumerate_attached_displays():
-        haystack = [d["device_name"], d["device_string"], *d["monitor_strings"]]
-        if any(token in (item or "").lower() for item in haystack):
+    if displays is None:
+        displays = _fresh_cached(with_monitors=True)
+    if displays is not None:
+        return next((d for d in displays if _display_matches_token(d, token)), {})
+
+    # Cold cache: stop enumerating at the first match.  Only a full sweep
+    # (no match) is cached, since a partial list would hide later adapters.
+    now = time.monotonic()
+    seen: List[dict] = []
+    for d in _iter_attached_displays(with_monitors=True):
+        if _display_matches_token(d, token):
             return d
+        seen.append(d)
+    _enum_cache[True] = (now, seen)
     return {}
 
 
-def find_display_by_device_name(device_name: str) -> dict:
-    for d in enumerate_attached_displays():
-        if d["device_name"].lower() == device_name.lower():
+def find_display_by_device_name(device_name: str, displays: Optional[List[dict]] = None) -> dict:
+    want = device_name.lower()
+    for d in _enum_cached() if displays is None else displays:
+        if d["device_name"].lower() == want:
             return d
     return {}
 
 
-def current_primary_display() -> dict:
-    for d in enumerate_attached_displays():
+def current_primary_display(displays: Optional[List[dict]] = None) -> dict:
+    for d in _enum_cached() if displays is None else displays:
         if d["state_flags"] & win32con.DISPLAY_DEVICE_PRIMARY_DEVICE:
             return d
     return {}
@@ -92,6 +202,197 @@ def current_primary_device_name() -> str:
     return str(d.get("device_name", "")).strip()
 
 
+# Unlike the TTL'd enumeration cache this is kept until the next
+# invalidate_display_cache(), so only callers that invalidate on
+# WM_DISPLAYCHANGE themselves may use primary_device_name_cached().
+_primary_cache: dict = {}
+
+
+def primary_device_name_cached() -> str:
+    """current_primary_device_name(), reused until invalidate_display_cache()."""
+    name = _primary_cache.get("name")
+    if name is None:
+        name = current_primary_device_name()
+        _primary_cache["name"] = name
+        _primary_cache["name_lc"] = name.lower()
+    return name
+
+
+def primary_device_name_cached_lc() -> str:
+    """Lowercased primary_device_name_cached(), computed once per cache fill."""
+    name_lc = _primary_cache.get("name_lc")
+    if name_lc is None:
+        primary_device_name_cached()
+        name_lc = _primary_cache["name_lc"]
+    return name_lc
+
+
+# ---------------------------------------------------------------------------
+# DISPLAYCONFIG (QueryDisplayConfig / SetDisplayConfig) structures
+# ---------------------------------------------------------------------------
+
+try:
+    _user32 = ctypes.windll.user32
+except Exception:
+    _user32 = None
+
+_QDC_ONLY_ACTIVE_PATHS = 0x00000002
+_SDC_APPLY = 0x00000080
+_SDC_USE_SUPPLIED_DISPLAY_CONFIG = 0x00000020
+_SDC_SAVE_TO_DATABASE = 0x00000200
+_SDC_ALLOW_CHANGES = 0x00000400
+_DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME = 1
+_DISPLAYCONFIG_MODE_INFO_TYPE_SOURCE = 1
+_ERROR_SUCCESS = 0
+
+
+class _LUID(ctypes.Structure):
+    _fields_ = [("LowPart", ctypes.c_ulong), ("HighPart", ctypes.c_long)]
+
+
+class _Rational(ctypes.Structure):
+    _fields_ = [("Numerator", ctypes.c_uint32), ("Denominator", ctypes.c_uint32)]
+
+
+class _2DRegion(ctypes.Structure):
+    _fields_ = [("cx", ctypes.c_uint32), ("cy", ctypes.c_uint32)]
+
+
+class _VideoSignalInfo(ctypes.Structure):
+    _fields_ = [
+        ("pixelRate", ctypes.c_uint64),
+        ("hSyncFreq", _Rational),
+        ("vSyncFreq", _Rational),
+        ("activeSize", _2DRegion),
+        ("totalSize", _2DRegion),
+        ("videoStandard", ctypes.c_uint32),
+        ("scanLineOrdering", ctypes.c_int),
+    ]
+
+
+class _TargetMode(ctypes.Structure):
+    _fields_ = [("targetVideoSignalInfo", _VideoSignalInfo)]
+
+
+class _POINTL(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+
+class _SourceMode(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_uint32),
+        ("height", ctypes.c_uint32),
+        ("pixelFormat", ctypes.c_int),
+        ("position", _POINTL),
+    ]
+
+
+class _ModeInfoUnion(ctypes.Union):
+    _fields_ = [("targetMode", _TargetMode), ("sourceMode", _SourceMode)]
+
+
+class _ModeInfo(ctypes.Structure):
+    _fields_ = [
+        ("infoType", ctypes.c_int),
+        ("id", ctypes.c_uint32),
+        ("adapterId", _LUID),
+        ("info", _ModeInfoUnion),
+    ]
+
+
+class _PathSourceInfo(ctypes.Structure):
+    _fields_ = [
+        ("adapterId", _LUID),
+        ("id", ctypes.c_uint32),
+        ("modeInfoIdx", ctypes.c_uint32),
+        ("statusFlags", ctypes.c_uint32),
+    ]
+
+
+class _PathTargetInfo(ctypes.Structure):
+    _fields_ = [
+        ("adapterId", _LUID),
+        ("id", ctypes.c_uint32),
+        ("modeInfoIdx", ctypes.c_uint32),
+        ("outputTechnology", ctypes.c_int),
+        ("rotation", ctypes.c_int),
+        ("scaling", ctypes.c_int),
+        ("refreshRate", _Rational),
+        ("scanLineOrdering", ctypes.c_int),
+        ("targetAvailable", ctypes.c_int),
+        ("statusFlags", ctypes.c_uint32),
+    ]
+
+
+class _PathInfo(ctypes.Structure):
+    _fields_ = [
+        ("sourceInfo", _PathSourceInfo),
+        ("targetInfo", _PathTargetInfo),
+        ("flags", ctypes.c_uint32),
+    ]
+
+
+class _DeviceInfoHeader(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("size", ctypes.c_uint32),
+        ("adapterId", _LUID),
+        ("id", ctypes.c_uint32),
+    ]
+
+
+class _SourceDeviceName(ctypes.Structure):
+    _fields_ = [
+        ("header", _DeviceInfoHeader),
+        ("viewGdiDeviceName", ctypes.c_wchar * 32),
+    ]
+
+
+if _user32 is not None:
+    # Explicit prototypes let ctypes skip per-argument type inference.
+    _user32.GetDisplayConfigBufferSizes.argtypes = [
+        ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32),
+    ]
+    _user32.GetDisplayConfigBufferSizes.restype = ctypes.c_long
+    _user32.QueryDisplayConfig.argtypes = [
+        ctypes.c_uint32,
+        ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(_PathInfo),
+        ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(_ModeInfo),
+        ctypes.c_void_p,
+    ]
+    _user32.QueryDisplayConfig.restype = ctypes.c_long
+    # Takes any DISPLAYCONFIG_* packet that starts with a _DeviceInfoHeader.
+    _user32.DisplayConfigGetDeviceInfo.argtypes = [ctypes.c_void_p]
+    _user32.DisplayConfigGetDeviceInfo.restype = ctypes.c_long
+    _user32.SetDisplayConfig.argtypes = [
+        ctypes.c_uint32, ctypes.POINTER(_PathInfo),
+        ctypes.c_uint32, ctypes.POINTER(_ModeInfo),
+        ctypes.c_uint32,
+    ]
+    _user32.SetDisplayConfig.restype = ctypes.c_long
+
+
+# Per-thread backing store for QueryDisplayConfig arrays.  The buffers are
+# reused (and only grown) across calls, skipping a fresh allocation and
+# zero-fill each time; QueryDisplayConfig overwrites every entry it reports.
+_config_buffers = threading.local()
+
+
+def _config_arrays(num_paths: int, num_modes: int):
+    """Return (paths, modes) ctypes arrays backed by the reusable buffers."""
+    arrays = []
+    for attr, elem, count in (("paths", _PathInfo, num_paths), ("modes", _ModeInfo, num_modes)):
+        need = max(count, 1) * ctypes.sizeof(elem)
+        buf = getattr(_config_buffers, attr, None)
+        if buf is None or len(buf) < need:
+            # Replace rather than resize: a bytearray with live ctypes views
+            # cannot change size.
+            buf = bytearray(max(need, 64 * ctypes.sizeof(elem)))
+            setattr(_config_buffers, attr, buf)
+        arrays.append((elem * count).from_buffer(buf))
+    return arrays[0], arrays[1]
+
+
 def get_rational_refresh_map() -> dict:
     """Return {gdi_device_name.lower(): (numerator, denominator)} for all active display paths.
 
@@ -100,131 +401,36 @@ def get_rational_refresh_map() -> dict:
     For example, 60.000 Hz appears as (60, 1) and 59.94 Hz appears as (60000, 1001).
     Returns an empty dict on any failure.
     """
-    try:
-        user32 = ctypes.windll.user32
-    except Exception:
+    if _user32 is None:
         return {}
 
-    QDC_ONLY_ACTIVE_PATHS = 0x00000002
-    DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME = 1
-    ERROR_SUCCESS = 0
-
-    class _LUID(ctypes.Structure):
-        _fields_ = [("LowPart", ctypes.c_ulong), ("HighPart", ctypes.c_long)]
-
-    class _Rational(ctypes.Structure):
-        _fields_ = [("Numerator", ctypes.c_uint32), ("Denominator", ctypes.c_uint32)]
-
-    class _2DRegion(ctypes.Structure):
-        _fields_ = [("cx", ctypes.c_uint32), ("cy", ctypes.c_uint32)]
-
-    class _VideoSignalInfo(ctypes.Structure):
-        _fields_ = [
-            ("pixelRate", ctypes.c_uint64),
-            ("hSyncFreq", _Rational),
-            ("vSyncFreq", _Rational),
-            ("activeSize", _2DRegion),
-            ("totalSize", _2DRegion),
-            ("videoStandard", ctypes.c_uint32),
-            ("scanLineOrdering", ctypes.c_int),
-        ]
-
-    class _TargetMode(ctypes.Structure):
-        _fields_ = [("targetVideoSignalInfo", _VideoSignalInfo)]
-
-    class _POINTL(ctypes.Structure):
-        _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-
-    class _SourceMode(ctypes.Structure):
-        _fields_ = [
-            ("width", ctypes.c_uint32),
-            ("height", ctypes.c_uint32),
-            ("pixelFormat", ctypes.c_int),
-            ("position", _POINTL),
-        ]
-
-    class _ModeInfoUnion(ctypes.Union):
-        _fields_ = [("targetMode", _TargetMode), ("sourceMode", _SourceMode)]
-
-    class _ModeInfo(ctypes.Structure):
-        _fields_ = [
-            ("infoType", ctypes.c_int),
-            ("id", ctypes.c_uint32),
-            ("adapterId", _LUID),
-            ("info", _ModeInfoUnion),
-        ]
-
-    class _PathSourceInfo(ctypes.Structure):
-        _fields_ = [
-            ("adapterId", _LUID),
-            ("id", ctypes.c_uint32),
-            ("modeInfoIdx", ctypes.c_uint32),
-            ("statusFlags", ctypes.c_uint32),
-        ]
-
-    class _PathTargetInfo(ctypes.Structure):
-        _fields_ = [
-            ("adapterId", _LUID),
-            ("id", ctypes.c_uint32),
-            ("modeInfoIdx", ctypes.c_uint32),
-            ("outputTechnology", ctypes.c_int),
-            ("rotation", ctypes.c_int),
-            ("scaling", ctypes.c_int),
-            ("refreshRate", _Rational),
-            ("scanLineOrdering", ctypes.c_int),
-            ("targetAvailable", ctypes.c_int),
-            ("statusFlags", ctypes.c_uint32),
-        ]
-
-    class _PathInfo(ctypes.Structure):
-        _fields_ = [
-            ("sourceInfo", _PathSourceInfo),
-            ("targetInfo", _PathTargetInfo),
-            ("flags", ctypes.c_uint32),
-        ]
-
-    class _DeviceInfoHeader(ctypes.Structure):
-        _fields_ = [
-            ("type", ctypes.c_int),
-            ("size", ctypes.c_uint32),
-            ("adapterId", _LUID),
-            ("id", ctypes.c_uint32),
-        ]
-
-    class _SourceDeviceName(ctypes.Structure):
-        _fields_ = [
-            ("header", _DeviceInfoHeader),
-            ("viewGdiDeviceName", ctypes.c_wchar * 32),
-        ]
-
     try:
         num_paths = ctypes.c_uint32()
         num_modes = ctypes.c_uint32()
-        ret = user32.GetDisplayConfigBufferSizes(
-            QDC_ONLY_ACTIVE_PATHS, ctypes.byref(num_paths), ctypes.byref(num_modes)
+        ret = _user32.GetDisplayConfigBufferSizes(
+            _QDC_ONLY_ACTIVE_PATHS, ctypes.byref(num_paths), ctypes.byref(num_modes)
         )
-        if ret != ERROR_SUCCESS:
+        if ret != _ERROR_SUCCESS:
             return {}
 
-        paths = (_PathInfo * num_paths.value)()
-        modes = (_ModeInfo * num_modes.value)()
-        ret = user32.QueryDisplayConfig(
-            QDC_ONLY_ACTIVE_PATHS,
+        paths, modes = _config_arrays(num_paths.value, num_modes.value)
+        ret = _user32.QueryDisplayConfig(
+            _QDC_ONLY_ACTIVE_PATHS,
             ctypes.byref(num_paths), paths,
             ctypes.byref(num_modes), modes,
             None,
         )
-        if ret != ERROR_SUCCESS:
+        if ret != _ERROR_SUCCESS:
             return {}
 
         result = {}
         for i in range(num_paths.value):
             info = _SourceDeviceName()
-            info.header.type = DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME
+            info.header.type = _DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME
             info.header.size = ctypes.sizeof(_SourceDeviceName)
             info.header.adapterId = paths[i].sourceInfo.adapterId
             info.header.id = paths[i].sourceInfo.id
-            if user32.DisplayConfigGetDeviceInfo(ctypes.byref(info)) == ERROR_SUCCESS:
+            if _user32.DisplayConfigGetDeviceInfo(ctypes.byref(info)) == _ERROR_SUCCESS:
                 gdi = info.viewGdiDeviceName.lower().rstrip("\x00")
                 n = paths[i].targetInfo.refreshRate.Numerator
                 d = paths[i].targetInfo.refreshRate.Denominator
@@ -247,18 +453,16 @@ def get_crt_display_rect(crt_tokens: List[str]) -> Optional[Tuple[int, int, int,
         d = find_display_by_token(token)
         if not d:
             continue
-        try:
-            dm = win32api.EnumDisplaySettings(d["device_name"], win32con.ENUM_CURRENT_SETTINGS)
-            x, y = d["position"]
-            w = int(dm.PelsWidth)
-            h = int(dm.PelsHeight)
-            print(
-                f"[re-stack] CRT display detected: {d['device_name']} "
-                f"x={x}, y={y}, w={w}, h={h}"
-            )
-            return (x, y, w, h)
-        except Exception as e:
-            print(f"[re-stack] Could not read CRT display mode from {d['device_name']}: {e}")
+        if d.get("width") is None or d.get("height") is None:
+            log.warning("Could not read CRT display mode from %s.", d["device_name"])
+            continue
+        x, y = d["position"]
+        w, h = d["width"], d["height"]
+        log.info(
+            "CRT display detected: %s x=%d, y=%d, w=%d, h=%d",
+            d["device_name"], x, y, w, h,
+        )
+        return (x, y, w, h)
     return None
 
 
@@ -274,17 +478,15 @@ def get_display_mode(display_token: str) -> Optional[dict]:
     target = find_display_by_token(display_token)
     if not target or win32api is None or win32con is None:
         return None
-    try:
-        dm = win32api.EnumDisplaySettings(target["device_name"], win32con.ENUM_CURRENT_SETTINGS)
-        return {
-            "device_name": target["device_name"],
-            "width": int(dm.PelsWidth),
-            "height": int(dm.PelsHeight),
-            "hz": int(dm.DisplayFrequency),
-        }
-    except Exception as e:
-        print(f"[re-stack] Could not read display mode for {target['device_name']}: {e}")
+    if target.get("width") is None:
+        log.warning("Could not read display mode for %s.", target["device_name"])
         return None
+    return {
+        "device_name": target["device_name"],
+        "width": target["width"],
+        "height": target["height"],
+        "hz": target["hz"],
+    }
 
 
 def restore_display_mode(saved: dict) -> bool:
@@ -310,12 +512,13 @@ def restore_display_mode(saved: dict) -> bool:
         for flags in (0, win32con.CDS_UPDATEREGISTRY):
             rc = win32api.ChangeDisplaySettingsEx(dev, dm, flags)
             if rc == win32con.DISP_CHANGE_SUCCESSFUL:
-                print(f"[re-stack] CRT mode restored: {w}x{h}@{hz}Hz on {dev}.")
+                invalidate_display_cache()
+                log.info("CRT mode restored: %sx%s@%sHz on %s.", w, h, hz, dev)
                 return True
-        print(f"[re-stack] CRT mode restore failed on {dev} (code {rc}).")
+        log.warning("CRT mode restore failed on %s (code %s).", dev, rc)
         return False
     except Exception as e:
-        print(f"[re-stack] CRT mode restore error on {dev}: {e}")
+        log.warning("CRT mode restore error on %s: %s", dev, e)
         return False
 
 
@@ -323,20 +526,35 @@ def restore_display_mode(saved: dict) -> bool:
 # Refresh rate
 # ---------------------------------------------------------------------------
 
+# device_name -> (monotonic time, Hz) last applied or confirmed by
+# set_display_refresh_best_effort; repeat nudges within the TTL return
+# without touching the driver.  Cleared by invalidate_display_cache().
+_HZ_CACHE_TTL_S = 2.0
+_hz_cache: dict = {}
+
+
 def set_display_refresh_best_effort(display_token: str, refresh_hz: int) -> bool:
     target = find_display_by_token(display_token)
     if not target:
-        print(f"[re-stack] Could not find display for refresh token: {display_token}")
+        log.warning("Could not find display for refresh token: %s", display_token)
         return False
     if win32api is None or win32con is None:
-        print("[re-stack] pywin32 display APIs unavailable; cannot set refresh.")
+        log.warning("pywin32 display APIs unavailable; cannot set refresh.")
         return False
 
     dev_name = target["device_name"]
+    cached = _hz_cache.get(dev_name)
+    if (
+        cached is not None
+        and cached[1] == int(refresh_hz)
+        and time.monotonic() - cached[0] < _HZ_CACHE_TTL_S
+    ):
+        return True
     try:
         dm = win32api.EnumDisplaySettings(dev_name, win32con.ENUM_CURRENT_SETTINGS)
         current = int(getattr(dm, "DisplayFrequency", 0) or 0)
         if current == int(refresh_hz):
+            _hz_cache[dev_name] = (time.monotonic(), current)
             return True
         dm.DisplayFrequency = int(refresh_hz)
         dm.Fields |= win32con.DM_DISPLAYFREQUENCY
@@ -344,15 +562,17 @@ def set_display_refresh_best_effort(display_token: str, refresh_hz: int) -> bool
         for flags in (0, win32con.CDS_UPDATEREGISTRY):
             rc = win32api.ChangeDisplaySettingsEx(dev_name, dm, flags)
             if rc == win32con.DISP_CHANGE_SUCCESSFUL:
-                print(f"[re-stack] Refresh corrected: {current} Hz -> {refresh_hz} Hz on {dev_name}.")
+                invalidate_display_cache()
+                _hz_cache[dev_name] = (time.monotonic(), int(refresh_hz))
+                log.info("Refresh corrected: %s Hz -> %s Hz on %s.", current, refresh_hz, dev_name)
                 return True
-        print(
-            f"[re-stack] Failed to correct refresh from {current} Hz to {refresh_hz} Hz "
-            f"on {dev_name} (code {rc})."
+        log.warning(
+            "Failed to correct refresh from %s Hz to %s Hz on %s (code %s).",
+            current, refresh_hz, dev_name, rc,
         )
         return False
     except Exception as e:
-        print(f"[re-stack] Refresh switch error on {dev_name}: {e}")
+        log.warning("Refresh switch error on %s: %s", dev_name, e)
         return False
 
 
@@ -367,211 +587,136 @@ def set_primary_via_setdisplayconfig(target_device_name: str) -> bool:
     determines the primary monitor. Works with virtual display drivers that reject
     ChangeDisplaySettingsEx CDS_SET_PRIMARY.
     """
-    try:
-        user32 = ctypes.windll.user32
-    except Exception:
+    if _user32 is None:
         return False
 
-    QDC_ONLY_ACTIVE_PATHS = 0x00000002
-    SDC_APPLY = 0x00000080
-    SDC_USE_SUPPLIED_DISPLAY_CONFIG = 0x00000020
-    SDC_SAVE_TO_DATABASE = 0x00000200
-    SDC_ALLOW_CHANGES = 0x00000400
-    DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME = 1
-    DISPLAYCONFIG_MODE_INFO_TYPE_SOURCE = 1
-    ERROR_SUCCESS = 0
-
-    class _LUID(ctypes.Structure):
-        _fields_ = [("LowPart", ctypes.c_ulong), ("HighPart", ctypes.c_long)]
-
-    class _Rational(ctypes.Structure):
-        _fields_ = [("Numerator", ctypes.c_uint32), ("Denominator", ctypes.c_uint32)]
-
-    class _2DRegion(ctypes.Structure):
-        _fields_ = [("cx", ctypes.c_uint32), ("cy", ctypes.c_uint32)]
-
-    class _VideoSignalInfo(ctypes.Structure):
-        _fields_ = [
-            ("pixelRate", ctypes.c_uint64),
-            ("hSyncFreq", _Rational),
-            ("vSyncFreq", _Rational),
-            ("activeSize", _2DRegion),
-            ("totalSize", _2DRegion),
-            ("videoStandard", ctypes.c_uint32),
-            ("scanLineOrdering", ctypes.c_int),
-        ]
-
-    class _TargetMode(ctypes.Structure):
-        _fields_ = [("targetVideoSignalInfo", _VideoSignalInfo)]
-
-    class _POINTL(ctypes.Structure):
-        _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-
-    class _SourceMode(ctypes.Structure):
-        _fields_ = [
-            ("width", ctypes.c_uint32),
-            ("height", ctypes.c_uint32),
-            ("pixelFormat", ctypes.c_int),
-            ("position", _POINTL),
-        ]
-
-    class _ModeInfoUnion(ctypes.Union):
-        _fields_ = [("targetMode", _TargetMode), ("sourceMode", _SourceMode)]
-
-    class _ModeInfo(ctypes.Structure):
-        _fields_ = [
-            ("infoType", ctypes.c_int),
-            ("id", ctypes.c_uint32),
-            ("adapterId", _LUID),
-            ("info", _ModeInfoUnion),
-        ]
-
-    class _PathSourceInfo(ctypes.Structure):
-        _fields_ = [
-            ("adapterId", _LUID),
-            ("id", ctypes.c_uint32),
-            ("modeInfoIdx", ctypes.c_uint32),
-            ("statusFlags", ctypes.c_uint32),
-        ]
-
-    class _PathTargetInfo(ctypes.Structure):
-        _fields_ = [
-            ("adapterId", _LUID),
-            ("id", ctypes.c_uint32),
-            ("modeInfoIdx", ctypes.c_uint32),
-            ("outputTechnology", ctypes.c_int),
-            ("rotation", ctypes.c_int),
-            ("scaling", ctypes.c_int),
-            ("refreshRate", _Rational),
-            ("scanLineOrdering", ctypes.c_int),
-            ("targetAvailable", ctypes.c_int),
-            ("statusFlags", ctypes.c_uint32),
-        ]
-
-    class _PathInfo(ctypes.Structure):
-        _fields_ = [
-            ("sourceInfo", _PathSourceInfo),
-            ("targetInfo", _PathTargetInfo),
-            ("flags", ctypes.c_uint32),
-        ]
-
-    class _DeviceInfoHeader(ctypes.Structure):
-        _fields_ = [
-            ("type", ctypes.c_int),
-            ("size", ctypes.c_uint32),
-            ("adapterId", _LUID),
-            ("id", ctypes.c_uint32),
-        ]
-
-    class _SourceDeviceName(ctypes.Structure):
-        _fields_ = [
-            ("header", _DeviceInfoHeader),
-            ("viewGdiDeviceName", ctypes.c_wchar * 32),
-        ]
-
     try:
         num_paths = ctypes.c_uint32()
         num_modes = ctypes.c_uint32()
-        ret = user32.GetDisplayConfigBufferSizes(
-            QDC_ONLY_ACTIVE_PATHS, ctypes.byref(num_paths), ctypes.byref(num_modes)
+        ret = _user32.GetDisplayConfigBufferSizes(
+            _QDC_ONLY_ACTIVE_PATHS, ctypes.byref(num_paths), ctypes.byref(num_modes)
         )
-        if ret != ERROR_SUCCESS:
-            print(f"[re-stack] SetDisplayConfig: GetDisplayConfigBufferSizes failed ({ret}).")
+        if ret != _ERROR_SUCCESS:
+            log.warning("SetDisplayConfig: GetDisplayConfigBufferSizes failed (%s).", ret)
             return False
 
-        paths = (_PathInfo * num_paths.value)()
-        modes = (_ModeInfo * num_modes.value)()
-        ret = user32.QueryDisplayConfig(
-            QDC_ONLY_ACTIVE_PATHS,
+        paths, modes = _config_arrays(num_paths.value, num_modes.value)
+        ret = _user32.QueryDisplayConfig(
+            _QDC_ONLY_ACTIVE_PATHS,
             ctypes.byref(num_paths), paths,
             ctypes.byref(num_modes), modes,
             None,
         )
-        if ret != ERROR_SUCCESS:
-            print(f"[re-stack] SetDisplayConfig: QueryDisplayConfig failed ({ret}).")
+        if ret != _ERROR_SUCCESS:
+            log.warning("SetDisplayConfig: QueryDisplayConfig failed (%s).", ret)
             return False
 
         want = target_device_name.lower().rstrip("\x00")
-        target_src_id = None
-        target_adapter = None
+        target_path = None
+        queried_sources: set = set()
         for i in range(num_paths.value):
+            src = paths[i].sourceInfo
+            key = (src.id, src.adapterId.LowPart, src.adapterId.HighPart)
+            if key in queried_sources:
+                continue  # cloned paths share a source; its name is already known
+            queried_sources.add(key)
             info = _SourceDeviceName()
-            info.header.type = DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME
+            info.header.type = _DISPLAYCONFIG_DEVICE_INFO_GET_SOURCE_NAME
             info.header.size = ctypes.sizeof(_SourceDeviceName)
-            info.header.adapterId = paths[i].sourceInfo.adapterId
-            info.header.id = paths[i].sourceInfo.id
-            if user32.DisplayConfigGetDeviceInfo(ctypes.byref(info)) == ERROR_SUCCESS:
+            info.header.adapterId = src.adapterId
+            info.header.id = src.id
+            if _user32.DisplayConfigGetDeviceInfo(ctypes.byref(info)) == _ERROR_SUCCESS:
                 gdi = info.viewGdiDeviceName.lower().rstrip("\x00")
                 if gdi == want:
-                    target_src_id = paths[i].sourceInfo.id
-                    target_adapter = paths[i].sourceInfo.adapterId
+                    target_path = paths[i]
                     break
 
-        if target_src_id is None:
-            print(f"[re-stack] SetDisplayConfig: no source matched '{target_device_name}'.")
+        if target_path is None:
+            log.warning("SetDisplayConfig: no source matched '%s'.", target_device_name)
             return False
 
-        tx, ty = None, None
+        # One pass over the mode list: index source modes by
+        # (id, adapter LUID) and remember them for the reposition step.
+        source_modes = {}
+        source_idx = []
         for i in range(num_modes.value):
             m = modes[i]
-            if (
-                m.infoType == DISPLAYCONFIG_MODE_INFO_TYPE_SOURCE
-                and m.id == target_src_id
-                and m.adapterId.LowPart == target_adapter.LowPart
-                and m.adapterId.HighPart == target_adapter.HighPart
-            ):
-                tx = m.info.sourceMode.position.x
-                ty = m.info.sourceMode.position.y
-                break
-
-        if tx is None:
-            print("[re-stack] SetDisplayConfig: target source mode not found in mode list.")
+            if m.infoType == _DISPLAYCONFIG_MODE_INFO_TYPE_SOURCE:
+                source_modes.setdefault((m.id, m.adapterId.LowPart, m.adapterId.HighPart), i)
+                source_idx.append(i)
+
+        src = target_path.sourceInfo
+        target_idx = source_modes.get((src.id, src.adapterId.LowPart, src.adapterId.HighPart))
+        if target_idx is None:
+            log.warning("SetDisplayConfig: target source mode not found in mode list.")
             return False
 
+        target_pos = modes[target_idx].info.sourceMode.position
+        tx, ty = target_pos.x, target_pos.y
         if tx == 0 and ty == 0:
-            print("[re-stack] SetDisplayConfig: target already at (0,0) — already primary.")
+            log.info("SetDisplayConfig: target already at (0,0) — already primary.")
             return True
 
-        for i in range(num_modes.value):
-            if modes[i].infoType == DISPLAYCONFIG_MODE_INFO_TYPE_SOURCE:
-                modes[i].info.sourceMode.position.x -= tx
-                modes[i].info.sourceMode.position.y -= ty
+        # Resolve each POINTL once; every ctypes attribute hop builds a
+        # temporary wrapper object.
+        for i in source_idx:
+            pos = modes[i].info.sourceMode.position
+            pos.x -= tx
+            pos.y -= ty
 
         flags = (
-            SDC_APPLY
-            | SDC_USE_SUPPLIED_DISPLAY_CONFIG
-            | SDC_SAVE_TO_DATABASE
-            | SDC_ALLOW_CHANGES
+            _SDC_APPLY
+            | _SDC_USE_SUPPLIED_DISPLAY_CONFIG
+            | _SDC_SAVE_TO_DATABASE
+            | _SDC_ALLOW_CHANGES
         )
-        ret = user32.SetDisplayConfig(
+        ret = _user32.SetDisplayConfig(
             num_paths.value, paths,
             num_modes.value, modes,
             flags,
         )
-        if ret == ERROR_SUCCESS:
-            print(f"[re-stack] SetDisplayConfig: primary set to '{target_device_name}'.")
+        if ret == _ERROR_SUCCESS:
+            invalidate_display_cache()
+            log.info("SetDisplayConfig: primary set to '%s'.", target_device_name)
             return True
-        print(f"[re-stack] SetDisplayConfig failed (code {ret}).")
+        log.warning("SetDisplayConfig failed (code %s).", ret)
         return False
 
     except Exception as e:
-        print(f"[re-stack] SetDisplayConfig exception: {e}")
+        log.warning("SetDisplayConfig exception: %s", e)
         return False
 
 
+# Device names whose CDS_SET_PRIMARY attempts all failed earlier in this
+# process.  Later calls for them go straight to SetDisplayConfig instead of
+# repeating three doomed ChangeDisplaySettingsEx round-trips.
+_cds_primary_rejected: set = set()
+
+
+def _needs_display_config(target: dict) -> bool:
+    return target["device_name"].lower() in _cds_primary_rejected
+
+
 def set_primary_display_entry(target: dict) -> bool:
     if win32api is None or win32con is None:
-        print("[re-stack] pywin32 display APIs unavailable; cannot set primary display.")
+        log.warning("pywin32 display APIs unavailable; cannot set primary display.")
         return False
     if not target:
         return False
 
-    displays = enumerate_attached_displays()
-    current_primary = current_primary_display()
+    displays = _enum_cached()
+    current_primary = current_primary_display(displays)
     if current_primary and current_primary.get("device_name") == target.get("device_name"):
-        print(f"[re-stack] Target already primary: {target['device_name']}")
+        log.info("Target already primary: %s", target["device_name"])
         return True
 
+    if _needs_display_config(target):
+        log.info(
+            "%s rejected CDS_SET_PRIMARY earlier; using SetDisplayConfig.",
+            target["device_name"],
+        )
+        return set_primary_via_setdisplayconfig(target["device_name"])
+
     tx, ty = target["position"]
 
     methods = [
@@ -579,12 +724,25 @@ def set_primary_display_entry(target: dict) -> bool:
         ("zero_pos", 0, 0, win32con.DM_POSITION),
         ("no_pos_change", None, None, 0),
     ]
+    # One DEVMODE serves every method.  The attempts are only staged
+    # (CDS_NORESET), so ENUM_CURRENT_SETTINGS would return the same mode each
+    # time; instead each method resets the fields the previous one touched.
+    # (pywin32's PyDEVMODE cannot be copied with copy.copy.)
+    target_dm = None
+    base_pos = (0, 0)
+    base_fields = 0
     target_set = False
     for label, px, py, field_mask in methods:
         try:
-            target_dm = win32api.EnumDisplaySettings(
-                target["device_name"], win32con.ENUM_CURRENT_SETTINGS
-            )
+            if target_dm is None:
+                target_dm = win32api.EnumDisplaySettings(
+                    target["device_name"], win32con.ENUM_CURRENT_SETTINGS
+                )
+                base_pos = (target_dm.Position_x, target_dm.Position_y)
+                base_fields = target_dm.Fields
+            else:
+                target_dm.Position_x, target_dm.Position_y = base_pos
+                target_dm.Fields = base_fields
             if field_mask & win32con.DM_POSITION:
                 if px is None or py is None:
                     pass
@@ -602,28 +760,35 @@ def set_primary_display_entry(target: dict) -> bool:
                 target["device_name"], target_dm, target_flags
             )
             if target_rc == win32con.DISP_CHANGE_SUCCESSFUL:
-                print(
-                    f"[re-stack] Target primary set using method '{label}' "
-                    f"for {target['device_name']}."
+                log.info(
+                    "Target primary set using method '%s' for %s.",
+                    label, target["device_name"],
                 )
                 target_set = True
                 break
-            print(
-                f"[re-stack] Target primary method '{label}' failed "
-                f"for {target['device_name']} (code {target_rc})."
+            log.warning(
+                "Target primary method '%s' failed for %s (code %s).",
+                label, target["device_name"], target_rc,
             )
         except Exception as e:
-            print(
-                f"[re-stack] Display switch exception with method '{label}' "
-                f"on target {target['device_name']}: {e}"
+            log.warning(
+                "Display switch exception with method '%s' on target %s: %s",
+                label, target["device_name"], e,
             )
 
     if not target_set:
-        print("[re-stack] ChangeDisplaySettingsEx methods exhausted; trying SetDisplayConfig.")
+        _cds_primary_rejected.add(target["device_name"].lower())
+        log.warning("ChangeDisplaySettingsEx methods exhausted; trying SetDisplayConfig.")
         return set_primary_via_setdisplayconfig(target["device_name"])
 
     # Reposition non-primary displays relative to the new origin.
     # (SetDisplayConfig handles this atomically when used as fallback.)
+    # These calls only stage registry changes (CDS_NORESET); the driver applies
+    # the whole batch in the single commit below.  They must stay on
+    # ChangeDisplaySettingsEx: a SetDisplayConfig here would leave the staged
+    # CDS_SET_PRIMARY pending for some later, unrelated commit to apply.
+    if (tx, ty) == (0, 0):
+        displays = []  # origin unchanged; nothing to shift
     for d in displays:
         if d["device_name"] == target["device_name"]:
             continue
@@ -638,16 +803,17 @@ def set_primary_display_entry(target: dict) -> bool:
                 win32con.CDS_UPDATEREGISTRY | win32con.CDS_NORESET,
             )
             if rc != win32con.DISP_CHANGE_SUCCESSFUL:
-                print(
-                    f"[re-stack] Warning: failed repositioning '{d['device_name']}' "
-                    f"(code {rc})."
+                log.warning(
+                    "Warning: failed repositioning '%s' (code %s).",
+                    d["device_name"], rc,
                 )
         except Exception as e:
-            print(f"[re-stack] Warning: display reposition error on {d['device_name']}: {e}")
+            log.warning("Warning: display reposition error on %s: %s", d["device_name"], e)
 
     final_rc = win32api.ChangeDisplaySettingsEx(None, None)
+    invalidate_display_cache()
     if final_rc != win32con.DISP_CHANGE_SUCCESSFUL:
-        print(f"[re-stack] Failed to commit display changes (code {final_rc}).")
+        log.warning("Failed to commit display changes (code %s).", final_rc)
         return False
     return True
 
@@ -655,31 +821,50 @@ def set_primary_display_entry(target: dict) -> bool:
 def set_primary_display(name_token: str) -> bool:
     target = find_display_by_token(name_token)
     if not target:
-        print(f"[re-stack] Could not find display matching token: {name_token}")
+        log.warning("Could not find display matching token: %s", name_token)
         return False
     ok = set_primary_display_entry(target)
     if ok:
-        print(f"[re-stack] Primary display set using token: {name_token}")
+        log.info("Primary display set using token: %s", name_token)
     return ok
 
 
 def set_primary_display_verified(name_token: str, retries: int = 3) -> bool:
     target = find_display_by_token(name_token)
     if not target:
-        print(f"[re-stack] Could not find display matching token: {name_token}")
+        log.warning("Could not find display matching token: %s", name_token)
         return False
     wanted = str(target.get("device_name", "")).strip().lower()
+    # Skip the switch attempt and the change-watcher window entirely.
+    if current_primary_device_name().lower() == wanted:
+        log.info("Target already primary: %s", target["device_name"])
+        return True
 
-    for attempt in range(1, retries + 1):
-        if not set_primary_display(name_token):
-            continue
-        active = current_primary_device_name().lower()
-        if active == wanted:
-            print(f"[re-stack] Verified primary display: {target['device_name']}")
-            return True
-        print(
-            f"[re-stack] Primary verify failed (attempt {attempt}/{retries}). "
-            f"Expected {target['device_name']}, got {active or 'UNKNOWN'}."
-        )
-        time.sleep(0.5)
+    # Listen for WM_DISPLAYCHANGE only (no WinEvent hooks); created before
+    # the switch so the broadcast is not missed.
+    with EventWaiter(hook_ranges=(), display_changes=True) as waiter:
+        listening = waiter.watches_display_changes()
+        for attempt in range(1, retries + 1):
+            waiter.consume_display_change()
+            if not set_primary_display(name_token):
+                continue
+            active = current_primary_device_name().lower()
+            if active != wanted:
+                if listening:
+                    changed = waiter.wait_for_display_change(1.5)
+                else:
+                    # Nothing to wait on; keep the plain 0.5 s retry spacing.
+                    time.sleep(0.5)
+                    changed = False
+                if changed:
+                    # The driver finished applying the topology after we read it.
+                    invalidate_display_cache()
+                    active = current_primary_device_name().lower()
+            if active == wanted:
+                log.info("Verified primary display: %s", target["device_name"])
+                return True
+            log.warning(
+                "Primary verify failed (attempt %d/%d). Expected %s, got %s.",
+                attempt, retries, target["device_name"], active or "UNKNOWN",
+            )
     return False
@@ -43,7 +43,8 @@ Schema (schema_version 1)
   ]
 }
 
-Validation guarantees (all errors reported in one pass):
+Validation guarantees (all errors of a phase reported in one pass; file
+checks only run once the structure is valid):
   - schema_version present and in SUPPORTED_SCHEMA_VERSIONS
   - primary.profile file exists
   - every watch[i].profile file exists
@@ -54,16 +55,23 @@ Validation guarantees (all errors reported in one pass):
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 SUPPORTED_SCHEMA_VERSIONS = {1}
 KNOWN_PATCH_TYPES = {"retroarch_cfg", "launchbox_emulator", "launchbox_settings"}
+_KNOWN_SORTED = sorted(KNOWN_PATCH_TYPES)
+
+# Watch lists at least this long have their profiles read on a thread pool;
+# below it, thread start-up costs more than the overlapped file I/O saves.
+_PARALLEL_PROFILE_READS_MIN = 8
 
 
 @dataclass
 class WatchEntry:
     profile: str
+    data: dict = field(default_factory=dict)  # parsed profile JSON ({} if unread)
 
 
 @dataclass
@@ -75,19 +83,94 @@ class Manifest:
 
 
 # ---------------------------------------------------------------------------
-# Public API
+# Internal helpers
 # ---------------------------------------------------------------------------
 
-def load(path: str) -> Manifest:
-    """Load and validate a session manifest JSON file.
+def _read_profile(path: str) -> Tuple[Optional[dict], Optional[Exception]]:
+    """Read one watch profile; returns (data, None) or (None, exception)."""
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            return json.load(f), None
+    except Exception as exc:
+        return None, exc
 
-    Raises ValueError with a multi-line message listing every validation
-    error if validation fails.  Raises OSError / json.JSONDecodeError if the
-    file cannot be read or parsed.
+
+def _exists(path: str, listings: Dict[str, Optional[Set[str]]]) -> bool:
+    """os.path.exists() backed by one os.scandir() per parent directory.
+
+    Manifests list many siblings (wrapper .bat files, LaunchBox XMLs), so
+    listing each directory once replaces a stat() per path.  *listings* is
+    the per-load() cache of normcased names.  Falls back to os.path.exists
+    when the directory cannot be listed or the path has no basename.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    parent, name = os.path.split(os.path.abspath(path))
+    if not name:
+        return os.path.exists(path)
+    key = os.path.normcase(parent)
+    if key not in listings:
+        try:
+            with os.scandir(parent) as it:
+                listings[key] = {os.path.normcase(e.name) for e in it}
+        except FileNotFoundError:
+            listings[key] = set()
+        except OSError:
+            listings[key] = None
+    names = listings[key]
+    if names is None:
+        return os.path.exists(path)
+    return os.path.normcase(name) in names
+
 
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def _validate_retroarch_cfg(i: int, patch: dict, errors: List[str]) -> None:
+    if "path" not in patch:
+        errors.append(f"patches[{i}] (retroarch_cfg): missing 'path'")
+    if "set_values" not in patch or not isinstance(patch["set_values"], dict):
+        errors.append(
+            f"patches[{i}] (retroarch_cfg): missing or invalid 'set_values'"
+        )
+
+
+def _validate_launchbox_emulator(i: int, patch: dict, errors: List[str]) -> None:
+    if "path" not in patch:
+        errors.append(f"patches[{i}] (launchbox_emulator): missing 'path'")
+    em_list = patch.get("emulators")
+    if em_list is None or not isinstance(em_list, list):
+        errors.append(
+            f"patches[{i}] (launchbox_emulator): missing or invalid 'emulators'"
+        )
+        return
+    for j, em in enumerate(em_list):
+        if not isinstance(em, dict):
+            errors.append(f"patches[{i}].emulators[{j}]: must be an object")
+            continue
+        if "title" not in em:
+            errors.append(f"patches[{i}].emulators[{j}]: missing 'title'")
+        if em.get("wrapper_bat") is None:
+            errors.append(f"patches[{i}].emulators[{j}]: missing 'wrapper_bat'")
+
+
+def _validate_launchbox_settings(i: int, patch: dict, errors: List[str]) -> None:
+    for field_name in ("bigbox_path", "settings_path"):
+        if patch.get(field_name) is None:
+            errors.append(
+                f"patches[{i}] (launchbox_settings): missing '{field_name}'"
+            )
+
+
+# Structural validator per patch type; keys must match KNOWN_PATCH_TYPES.
+_VALIDATORS = {
+    "retroarch_cfg": _validate_retroarch_cfg,
+    "launchbox_emulator": _validate_launchbox_emulator,
+    "launchbox_settings": _validate_launchbox_settings,
+}
+
+
+def _check_structure(data: dict) -> List[str]:
+    """Phase 1: required keys, types and patch fields.  No filesystem access."""
     errors: List[str] = []
 
     # --- schema_version ---
@@ -101,7 +184,6 @@ def load(path: str) -> Manifest:
         )
 
     # --- primary ---
-    primary: WatchEntry | None = None
     p_raw = data.get("primary")
     if p_raw is None:
         errors.append("Missing required field: primary")
@@ -109,15 +191,8 @@ def load(path: str) -> Manifest:
         errors.append("primary: must be an object")
     elif "profile" not in p_raw:
         errors.append("primary: missing required field 'profile'")
-    else:
-        if not os.path.exists(p_raw["profile"]):
-            errors.append(f"primary.profile not found: {p_raw['profile']}")
-        else:
-            primary = WatchEntry(profile=p_raw["profile"])
 
     # --- watch ---
-    watch: List[WatchEntry] = []
-    process_names_seen: dict = {}  # lower-cased name -> watch index of first occurrence
     w_raw = data.get("watch")
     if w_raw is None:
         errors.append("Missing required field: watch")
@@ -127,30 +202,8 @@ def load(path: str) -> Manifest:
         for i, entry in enumerate(w_raw):
             if not isinstance(entry, dict) or "profile" not in entry:
                 errors.append(f"watch[{i}]: missing required field 'profile'")
-                continue
-            profile_path = entry["profile"]
-            if not os.path.exists(profile_path):
-                errors.append(f"watch[{i}].profile not found: {profile_path}")
-                continue
-            try:
-                with open(profile_path, "r", encoding="utf-8-sig") as f:
-                    profile_data = json.load(f)
-                for pname in profile_data.get("process_name", []):
-                    pname_l = pname.lower()
-                    if pname_l in process_names_seen:
-                        errors.append(
-                            f"watch[{i}]: process name {pname!r} duplicates "
-                            f"watch[{process_names_seen[pname_l]}]"
-                        )
-                    else:
-                        process_names_seen[pname_l] = i
-            except Exception as exc:
-                errors.append(f"watch[{i}]: cannot read profile {profile_path}: {exc}")
-                continue
-            watch.append(WatchEntry(profile=profile_path))
 
     # --- patches ---
-    patches: List[dict] = []
     p_list = data.get("patches")
     if p_list is None:
         errors.append("Missing required field: patches")
@@ -158,93 +211,134 @@ def load(path: str) -> Manifest:
         errors.append("patches: must be a list")
     else:
         for i, patch in enumerate(p_list):
+            if not isinstance(patch, dict):
+                errors.append(f"patches[{i}]: must be an object")
+                continue
             t = patch.get("type")
             if t is None:
                 errors.append(f"patches[{i}]: missing required field 'type'")
                 continue
-            if t not in KNOWN_PATCH_TYPES:
+            validate = _VALIDATORS.get(t)
+            if validate is None:
                 errors.append(
                     f"patches[{i}]: unknown type {t!r}. "
-                    f"Known types: {sorted(KNOWN_PATCH_TYPES)}"
+                    f"Known types: {_KNOWN_SORTED}"
                 )
                 continue
+            validate(i, patch, errors)
 
-            patch_ok = True
+    return errors
 
-            if t == "retroarch_cfg":
-                if "path" not in patch:
-                    errors.append(f"patches[{i}] (retroarch_cfg): missing 'path'")
-                    patch_ok = False
-                elif not os.path.exists(patch["path"]):
-                    errors.append(
-                        f"patches[{i}] (retroarch_cfg): path not found: {patch['path']}"
-                    )
-                    patch_ok = False
-                if "set_values" not in patch or not isinstance(patch["set_values"], dict):
+
+def _check_files(data: dict) -> Tuple[WatchEntry, List[WatchEntry], List[str]]:
+    """Phase 2: existence checks and profile reads on a structurally valid manifest.
+
+    Returns (primary, watch, errors).
+    """
+    errors: List[str] = []
+    listings: Dict[str, Optional[Set[str]]] = {}
+
+    # --- primary ---
+    primary_path = data["primary"]["profile"]
+    primary = WatchEntry(profile=primary_path)
+    if not _exists(primary_path, listings):
+        errors.append(f"primary.profile not found: {primary_path}")
+    else:
+        # Unreadable primary profiles are reported by the caller.
+        primary_data, _ = _read_profile(primary_path)
+        primary.data = primary_data or {}
+
+    # --- watch ---
+    # Check existence first, then read the profiles (concurrently for large
+    # watch lists), then check duplicates in manifest order.
+    watch: List[WatchEntry] = []
+    process_names_seen: dict = {}  # lower-cased name -> watch index of first occurrence
+    items: List[tuple] = []  # (index, profile_path, found)
+    for i, entry in enumerate(data["watch"]):
+        profile_path = entry["profile"]
+        items.append((i, profile_path, _exists(profile_path, listings)))
+
+    read_paths = [p for _, p, found in items if found]
+    if len(read_paths) >= _PARALLEL_PROFILE_READS_MIN:
+        with ThreadPoolExecutor(max_workers=min(8, len(read_paths))) as pool:
+            results = iter(list(pool.map(_read_profile, read_paths)))
+    else:
+        results = iter([_read_profile(p) for p in read_paths])
+
+    for i, profile_path, found in items:
+        if not found:
+            errors.append(f"watch[{i}].profile not found: {profile_path}")
+            continue
+        profile_data, exc = next(results)
+        if exc is not None:
+            errors.append(f"watch[{i}]: cannot read profile {profile_path}: {exc}")
+            continue
+        try:
+            for pname in profile_data.get("process_name", []):
+                pname_l = pname.lower()
+                if pname_l in process_names_seen:
                     errors.append(
-                        f"patches[{i}] (retroarch_cfg): missing or invalid 'set_values'"
+                        f"watch[{i}]: process name {pname!r} duplicates "
+                        f"watch[{process_names_seen[pname_l]}]"
                     )
-                    patch_ok = False
+                else:
+                    process_names_seen[pname_l] = i
+        except Exception as exc:
+            errors.append(f"watch[{i}]: cannot read profile {profile_path}: {exc}")
+            continue
+        watch.append(WatchEntry(profile=profile_path, data=profile_data))
 
-            elif t == "launchbox_emulator":
-                if "path" not in patch:
-                    errors.append(f"patches[{i}] (launchbox_emulator): missing 'path'")
-                    patch_ok = False
-                elif not os.path.exists(patch["path"]):
+    # --- patches ---
+    for i, patch in enumerate(data["patches"]):
+        t = patch["type"]
+        if t in ("retroarch_cfg", "launchbox_emulator"):
+            if not _exists(patch["path"], listings):
+                errors.append(f"patches[{i}] ({t}): path not found: {patch['path']}")
+        if t == "launchbox_emulator":
+            for j, em in enumerate(patch["emulators"]):
+                bat = em["wrapper_bat"]
+                if not _exists(bat, listings):
                     errors.append(
-                        f"patches[{i}] (launchbox_emulator): path not found: {patch['path']}"
+                        f"patches[{i}].emulators[{j}]: wrapper_bat not found: {bat}"
                     )
-                    patch_ok = False
-                em_list = patch.get("emulators")
-                if em_list is None or not isinstance(em_list, list):
+        elif t == "launchbox_settings":
+            for field_name in ("bigbox_path", "settings_path"):
+                fp = patch[field_name]
+                if not _exists(fp, listings):
                     errors.append(
-                        f"patches[{i}] (launchbox_emulator): missing or invalid 'emulators'"
+                        f"patches[{i}] (launchbox_settings): "
+                        f"{field_name} not found: {fp}"
                     )
-                    patch_ok = False
-                else:
-                    for j, em in enumerate(em_list):
-                        if "title" not in em:
-                            errors.append(
-                                f"patches[{i}].emulators[{j}]: missing 'title'"
-                            )
-                            patch_ok = False
-                        bat = em.get("wrapper_bat")
-                        if bat is None:
-                            errors.append(
-                                f"patches[{i}].emulators[{j}]: missing 'wrapper_bat'"
-                            )
-                            patch_ok = False
-                        elif not os.path.exists(bat):
-                            errors.append(
-                                f"patches[{i}].emulators[{j}]: wrapper_bat not found: {bat}"
-                            )
-                            patch_ok = False
-
-            elif t == "launchbox_settings":
-                for field_name in ("bigbox_path", "settings_path"):
-                    fp = patch.get(field_name)
-                    if fp is None:
-                        errors.append(
-                            f"patches[{i}] (launchbox_settings): missing '{field_name}'"
-                        )
-                        patch_ok = False
-                    elif not os.path.exists(fp):
-                        errors.append(
-                            f"patches[{i}] (launchbox_settings): "
-                            f"{field_name} not found: {fp}"
-                        )
-                        patch_ok = False
-
-            if patch_ok:
-                patches.append(patch)
+
+    return primary, watch, errors
+
+
+def load(path: str) -> Manifest:
+    """Load and validate a session manifest JSON file.
+
+    Validation runs in two phases: structural checks first, then file
+    existence and profile reads.  Each phase reports all of its errors at
+    once; the filesystem phase is skipped when the structure is invalid,
+    since its paths cannot be trusted.
+
+    Raises ValueError with a multi-line message listing every validation
+    error if validation fails.  Raises OSError / json.JSONDecodeError if the
+    file cannot be read or parsed.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    errors = _check_structure(data)
+    if not errors:
+        primary, watch, errors = _check_files(data)
 
     if errors:
         bullet = "\n".join(f"  - {e}" for e in errors)
         raise ValueError(f"Manifest validation failed ({path}):\n{bullet}")
 
     return Manifest(
-        schema_version=schema_version,
+        schema_version=data["schema_version"],
         primary=primary,
         watch=watch,
-        patches=patches,
+        patches=data["patches"],
     )
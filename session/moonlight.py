@@ -1,97 +1,323 @@
 """Moonlight process management and window placement."""
 
+import ctypes
+import ctypes.wintypes
+import functools
 import json
 import os
+import re
 import subprocess
+import sys
 import time
-from typing import List, Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
 
+from session import _win32_procs
 from session.display_api import get_crt_display_rect
-from session.window_utils import find_window, is_window_fullscreen, move_window
+from session.window_utils import (
+    enum_windows,
+    find_window,
+    find_windows_for_pids,
+    is_window_fullscreen,
+    move_window,
+)
 
 try:
     import psutil
 except Exception:
     psutil = None
 
+try:
+    import win32gui
+    import win32process
+except Exception:
+    win32gui = None
+    win32process = None
 
-def moonlight_pids(moonlight_dir: str) -> List[int]:
-    pids: List[int] = []
-    if psutil is None:
-        return pids
-    wanted = os.path.normcase(os.path.normpath(moonlight_dir))
-    for proc in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
+_T = TypeVar("_T")
+
+# Poll backoff: start fast (new windows usually appear within 50-200 ms), then
+# settle at the old 500 ms cadence for the rest of the timeout.
+_POLL_FIRST_DELAY_S = 0.025
+_POLL_MAX_DELAY_S = 0.5
+
+
+# Snapshot of Moonlight-looking processes shared by the lookups below.  One
+# re-stack tick calls is_moonlight_running / find_moonlight_window /
+# is_moonlight_fullscreen back to back; a single process scan serves them all.
+# Rows are (pid, name_lower, exe_dir_normcase or "", cmdline mentions
+# moonlight).  Polling loops invalidate it after each sleep so every
+# iteration sees a fresh scan.
+_PROC_SNAPSHOT_TTL_S = 0.5
+_PROC_SNAPSHOT: dict = {"t": 0.0, "rows": None}
+
+
+def _invalidate_proc_snapshot() -> None:
+    _PROC_SNAPSHOT["rows"] = None
+
+
+@functools.lru_cache(maxsize=64)
+def _norm_dir(path: str) -> str:
+    """normcase(normpath(path)); the same few Moonlight paths recur every scan."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _cmdline_mentions_moonlight(cmdline: List[str]) -> bool:
+    # Per-argument test: no joined copy of the command line, and it usually
+    # stops at argv[0].  ("moonlight" has no space, so a join could not
+    # produce extra matches.)
+    return any("moonlight" in (arg or "").lower() for arg in cmdline)
+
+
+def _snapshot_row(pid: int, name: str, exe: str, cmdline: List[str]) -> Tuple[int, str, str, bool]:
+    exe_dir = _norm_dir(os.path.dirname(exe)) if exe else ""
+    return (int(pid), name, exe_dir, _cmdline_mentions_moonlight(cmdline))
+
+
+def _named_rows_toolhelp() -> List[Tuple[int, str, str, bool]]:
+    """Name-matched rows from one ToolHelp snapshot (Windows, no psutil scan)."""
+    rows = []
+    for pid, exe_name in _win32_procs.iter_process_names():
+        name = exe_name.lower()
+        if "moonlight" not in name:
+            continue
+        exe = _win32_procs.process_image_path(pid) or ""
+        cmdline: List[str] = []
+        if not exe and psutil is not None:
+            # Image path unreadable: keep the cmdline for is_moonlight_running.
+            try:
+                cmdline = psutil.Process(pid).cmdline() or []
+            except Exception:
+                pass
+        rows.append(_snapshot_row(pid, name, exe, cmdline))
+    return rows
+
+
+def _named_rows_psutil() -> List[Tuple[int, str, str, bool]]:
+    rows = []
+    # exe/cmdline are the expensive per-process reads, so fetch them only for
+    # processes whose (cheap) name mentions Moonlight.
+    for proc in psutil.process_iter(["name"]):
         try:
             name = str(proc.info.get("name") or "").lower()
-            exe = str(proc.info.get("exe") or "")
-            cmd = " ".join(proc.info.get("cmdline") or [])
-            if "moonlight" not in name and "moonlight" not in cmd.lower():
+            if "moonlight" not in name:
                 continue
-            if exe:
-                exe_dir = os.path.normcase(os.path.normpath(os.path.dirname(exe)))
-                if exe_dir == wanted:
-                    pids.append(int(proc.info["pid"]))
-            else:
-                pids.append(int(proc.info["pid"]))
+            with proc.oneshot():
+                try:
+                    exe = proc.exe() or ""
+                except psutil.AccessDenied:
+                    exe = ""
+                try:
+                    cmdline = proc.cmdline() or []
+                except psutil.AccessDenied:
+                    cmdline = []
+            rows.append(_snapshot_row(proc.pid, name, exe, cmdline))
         except Exception:
             continue
-    return pids
+    return rows
+
+
+def _get_proc_snapshot(ttl: float = _PROC_SNAPSHOT_TTL_S) -> List[Tuple[int, str, str, bool]]:
+    if psutil is None and not _win32_procs.available():
+        return []
+    now = time.monotonic()
+    rows = _PROC_SNAPSHOT["rows"]
+    if rows is not None and now - _PROC_SNAPSHOT["t"] < ttl:
+        return rows
+    rows = []
+    if _win32_procs.available():
+        try:
+            rows = _named_rows_toolhelp()
+        except Exception:
+            rows = _named_rows_psutil() if psutil is not None else []
+    elif psutil is not None:
+        rows = _named_rows_psutil()
+    _PROC_SNAPSHOT["t"] = now
+    _PROC_SNAPSHOT["rows"] = rows
+    return rows
+
 
+def _cmdline_rows_psutil() -> List[Tuple[int, str, str, bool]]:
+    """Rows for processes whose command line mentions Moonlight.
 
-def is_moonlight_running(moonlight_dir: str) -> bool:
+    Covers Moonlight started through a differently named host process.  This
+    reads every process's exe and cmdline, so it is only used for one-off
+    checks, never from a polling loop.
+    """
+    rows: List[Tuple[int, str, str, bool]] = []
     if psutil is None:
-        return False
-    wanted = os.path.normcase(os.path.normpath(moonlight_dir))
-    for proc in psutil.process_iter(["name", "exe", "cmdline"]):
+        return rows
+    for proc in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
         try:
-            name = str(proc.info.get("name") or "").lower()
-            exe = str(proc.info.get("exe") or "")
-            cmd = " ".join(proc.info.get("cmdline") or [])
-            if "moonlight" not in name and "moonlight" not in cmd.lower():
+            cmdline = proc.info.get("cmdline") or []
+            if not _cmdline_mentions_moonlight(cmdline):
                 continue
-            if exe:
-                exe_dir = os.path.normcase(os.path.normpath(os.path.dirname(exe)))
-                if exe_dir == wanted:
-                    return True
-            else:
-                if "moonlight" in cmd.lower():
-                    return True
+            rows.append(_snapshot_row(
+                proc.info["pid"],
+                str(proc.info.get("name") or "").lower(),
+                str(proc.info.get("exe") or ""),
+                cmdline,
+            ))
         except Exception:
             continue
+    return rows
+
+
+_missing_dirs_warned: Set[str] = set()
+
+
+def _moonlight_dir_exists(moonlight_dir: str) -> bool:
+    """False (warning once per path) when moonlight_dir is not a directory."""
+    if os.path.isdir(moonlight_dir):
+        return True
+    if moonlight_dir not in _missing_dirs_warned:
+        _missing_dirs_warned.add(moonlight_dir)
+        print(f"[re-stack] Moonlight directory not found: {moonlight_dir}; skipping process scan.")
+    return False
+
+
+def _iter_moonlight_pids(moonlight_dir: str) -> Iterator[int]:
+    """Yield Moonlight PIDs from the process snapshot."""
+    if not _moonlight_dir_exists(moonlight_dir):
+        return
+    wanted = _norm_dir(moonlight_dir)
+    for pid, _name, exe_dir, _cmd_match in _get_proc_snapshot():
+        if exe_dir and exe_dir != wanted:
+            continue
+        yield pid
+
+
+def moonlight_pids(moonlight_dir: str) -> List[int]:
+    return list(_iter_moonlight_pids(moonlight_dir))
+
+
+def _rows_show_moonlight(rows: List[Tuple[int, str, str, bool]], wanted: str) -> bool:
+    for _pid, _name, exe_dir, cmd_match in rows:
+        if exe_dir:
+            if exe_dir == wanted:
+                return True
+        elif cmd_match:
+            return True
     return False
 
 
+def is_moonlight_running(moonlight_dir: str, scan_cmdlines: bool = False) -> bool:
+    """True if a Moonlight process from moonlight_dir is running.
+
+    scan_cmdlines adds a full command-line sweep when no Moonlight-named
+    process is found; leave it off in polling loops.
+    """
+    if not _moonlight_dir_exists(moonlight_dir):
+        return False
+    wanted = _norm_dir(moonlight_dir)
+    rows = _get_proc_snapshot()
+    if _rows_show_moonlight(rows, wanted):
+        return True
+    if scan_cmdlines and not rows:
+        return _rows_show_moonlight(_cmdline_rows_psutil(), wanted)
+    return False
+
+
+def _poll_with_backoff(check: Callable[[], _T], timeout_s: float) -> Optional[_T]:
+    """Call check() until it returns a truthy value or timeout_s elapses.
+
+    Sleeps between attempts with exponential backoff and drops the process
+    snapshot after each sleep so every attempt sees the current process table.
+    """
+    deadline = time.monotonic() + timeout_s
+    delay = _POLL_FIRST_DELAY_S
+    while True:
+        result = check()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, _POLL_MAX_DELAY_S)
+        _invalidate_proc_snapshot()
+
+
+if sys.platform == "win32":
+    _WaitForInputIdle = ctypes.WinDLL("user32", use_last_error=True).WaitForInputIdle
+    # HANDLE, not the int default, so the handle isn't truncated on 64-bit.
+    _WaitForInputIdle.argtypes = (ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD)
+    _WaitForInputIdle.restype = ctypes.wintypes.DWORD
+else:
+    _WaitForInputIdle = None
+
+
+def _wait_for_input_idle(proc: subprocess.Popen, timeout_ms: int) -> None:
+    """Block until a freshly started GUI process is ready for input (Windows only)."""
+    if _WaitForInputIdle is None:
+        return
+    # Popen keeps its process handle (full access) in _handle on Windows;
+    # it's private, so tolerate it being absent rather than depend on it.
+    handle = getattr(proc, "_handle", None)
+    if handle is None:
+        return
+    try:
+        _WaitForInputIdle(int(handle), timeout_ms)
+    except Exception:
+        pass
+
+
 def ensure_moonlight_running(moonlight_exe: str, moonlight_dir: str) -> bool:
-    if is_moonlight_running(moonlight_dir):
+    # One full command-line sweep here, before deciding to launch; the
+    # post-launch poll below only uses the name-filtered snapshot.
+    if is_moonlight_running(moonlight_dir, scan_cmdlines=True):
         print("[re-stack] Moonlight is already running.")
         return True
     if not os.path.exists(moonlight_exe):
         print(f"[re-stack] Moonlight executable not found: {moonlight_exe}")
         return False
     try:
-        subprocess.Popen([moonlight_exe], cwd=moonlight_dir)
+        proc = subprocess.Popen([moonlight_exe], cwd=moonlight_dir)
     except Exception as e:
         print(f"[re-stack] Failed to start Moonlight: {e}")
         return False
-    for _ in range(30):
-        time.sleep(0.5)
-        if is_moonlight_running(moonlight_dir):
-            print("[re-stack] Moonlight started.")
-            return True
+    started = time.monotonic()
+    _wait_for_input_idle(proc, 15000)
+    _invalidate_proc_snapshot()
+    remaining = max(0.0, 15.0 - (time.monotonic() - started))
+    if _poll_with_backoff(lambda: is_moonlight_running(moonlight_dir), remaining):
+        print("[re-stack] Moonlight started.")
+        return True
     print("[re-stack] Moonlight did not appear as running in time.")
     return False
 
 
+def _pick_moonlight_window(
+    windows: List[Tuple[int, str, int, bool]]
+) -> Tuple[Optional[int], bool]:
+    """Choose from find_windows_for_pids candidates (largest first).
+
+    Preference: visible window titled "moonlight" (idle state), then any
+    visible window (streaming changes the title), then a minimized one.
+    Returns (hwnd, iconic).
+    """
+    for hwnd, title, _area, iconic in windows:
+        if not iconic and "moonlight" in title:
+            return hwnd, False
+    for hwnd, _title, _area, iconic in windows:
+        if not iconic:
+            return hwnd, False
+    for hwnd, _title, _area, iconic in windows:
+        return hwnd, True
+    return None, False
+
+
 def is_moonlight_fullscreen(moonlight_dir: str) -> bool:
     """Return True if the Moonlight window is currently in fullscreen mode.
 
     Searches all Moonlight PIDs. Returns True as soon as any window is detected
     as fullscreen (title bar gone or window rect matches its monitor).
     """
-    for pid in moonlight_pids(moonlight_dir):
-        hwnd = find_window(pid, [], ["moonlight"], match_any_pid=False)
-        if hwnd is None:
-            hwnd = find_window(pid, [], [], match_any_pid=False)
+    pids = moonlight_pids(moonlight_dir)
+    if not pids:
+        return False
+    windows = find_windows_for_pids(pids, [])
+    for pid in pids:
+        hwnd, _ = _pick_moonlight_window(windows[pid])
         if hwnd and is_window_fullscreen(hwnd):
             return True
     return False
@@ -107,40 +333,105 @@ def is_gameplay_window_visible(title_fragment: str) -> bool:
     return find_window(None, [], [title_fragment.lower()]) is not None
 
 
+def visible_title_fragments(title_fragments: List[str]) -> Set[str]:
+    """Return the lower-cased fragments found in any visible top-level window title.
+
+    One window walk serves every fragment, so a poll that watches several
+    titles (gameplay window, config window) pays for enumeration once.  A
+    compiled alternation rejects non-matching titles before the per-fragment
+    test.  Visibility rules match is_gameplay_window_visible.
+    """
+    frags = sorted({f.lower() for f in title_fragments if f})
+    found: Set[str] = set()
+    if not frags or win32gui is None:
+        return found
+    prefilter = re.compile("|".join(map(re.escape, frags)))
+    for hwnd in enum_windows():
+        try:
+            if not win32gui.IsWindowVisible(hwnd) or win32gui.IsIconic(hwnd):
+                continue
+            title = win32gui.GetWindowText(hwnd).lower()
+        except Exception:
+            continue
+        if not prefilter.search(title):
+            continue
+        found.update(f for f in frags if f in title)
+        if len(found) == len(frags):
+            break
+    return found
+
+
+def is_any_gameplay_window_visible(title_fragments: List[str]) -> bool:
+    """Return True if any visible top-level window title contains any fragment."""
+    return bool(visible_title_fragments(title_fragments))
+
+
+# Last Moonlight window found, reused for _HWND_CACHE_TTL_S as long as the
+# handle is still a window owned by a live Moonlight PID.
+_HWND_CACHE_TTL_S = 2.0
+_HWND_CACHE: dict = {"pid": None, "hwnd": None, "t": 0.0}
+
+
+def _remember_hwnd(pid: int, hwnd: int) -> int:
+    _HWND_CACHE.update(pid=pid, hwnd=hwnd, t=time.monotonic())
+    return hwnd
+
+
+def _cached_moonlight_hwnd(moonlight_dir: str) -> Optional[int]:
+    pid, hwnd = _HWND_CACHE["pid"], _HWND_CACHE["hwnd"]
+    if hwnd is None or time.monotonic() - _HWND_CACHE["t"] >= _HWND_CACHE_TTL_S:
+        return None
+    if win32gui is None or win32process is None:
+        return None
+    try:
+        if not win32gui.IsWindow(hwnd):
+            return None
+        if win32process.GetWindowThreadProcessId(hwnd)[1] != pid:
+            return None  # handle recycled by another process
+    except Exception:
+        return None
+    if pid not in _iter_moonlight_pids(moonlight_dir):
+        return None
+    return hwnd
+
+
 def find_moonlight_window(moonlight_dir: str) -> Optional[int]:
+    hwnd = _cached_moonlight_hwnd(moonlight_dir)
+    if hwnd:
+        return hwnd
     pids = moonlight_pids(moonlight_dir)
     if not pids:
         print("[re-stack] DEBUG moonlight: no Moonlight PIDs found")
         return None
+    # One window walk covers every PID and all three preference tiers.
+    # Minimized windows are included: fullscreen games often push Moonlight
+    # to the taskbar, and move_window() restores it before repositioning.
+    windows = find_windows_for_pids(pids, [], include_iconic=True)
     for pid in pids:
-        # 1. Visible window with "moonlight" in title (normal idle state)
-        hwnd = find_window(pid, [], ["moonlight"], match_any_pid=False)
-        if hwnd:
-            return hwnd
-        # 2. Any visible window for this PID (streaming changes the title)
-        hwnd = find_window(pid, [], [], match_any_pid=False)
-        if hwnd:
-            return hwnd
-        # 3. Minimized/iconic window — fullscreen games often push Moonlight
-        #    to the taskbar.  move_window() will restore it before repositioning.
-        hwnd = find_window(pid, [], [], match_any_pid=False, include_iconic=True)
-        if hwnd:
+        hwnd, iconic = _pick_moonlight_window(windows[pid])
+        if hwnd and iconic:
             try:
-                import win32gui as _wg
-                title = _wg.GetWindowText(hwnd)
+                title = win32gui.GetWindowText(hwnd)
             except Exception:
                 title = "?"
             print(f"[re-stack] DEBUG moonlight: found minimized window pid={pid} title={title!r}")
-            return hwnd
+        if hwnd:
+            return _remember_hwnd(pid, hwnd)
         print(f"[re-stack] DEBUG moonlight: pid={pid} — no window found (visible or iconic)")
     return None
 
 
+@functools.lru_cache(maxsize=4)
+def _load_json_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a JSON config once per (path, mtime); callers must not mutate it."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
 def _crt_fallback_rect(crt_config_path: Optional[str]) -> Tuple[int, int, int, int]:
     if crt_config_path:
         try:
-            with open(crt_config_path, "r", encoding="utf-8-sig") as f:
-                cfg = json.load(f)
+            cfg = _load_json_cached(crt_config_path, os.stat(crt_config_path).st_mtime_ns)
             li = cfg.get("launcher_integration", {})
             return (
                 int(li.get("x", -1211)),
@@ -153,22 +444,6 @@ def _crt_fallback_rect(crt_config_path: Optional[str]) -> Tuple[int, int, int, i
     return (-1211, 43, 1057, 835)
 
 
-def _intersection_area(
-    a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]
-) -> int:
-    ax, ay, aw, ah = a
-    bx, by, bw, bh = b
-    ax2, ay2 = ax + aw, ay + ah
-    bx2, by2 = bx + bw, by + bh
-    ix1 = max(ax, bx)
-    iy1 = max(ay, by)
-    ix2 = min(ax2, bx2)
-    iy2 = min(ay2, by2)
-    if ix2 <= ix1 or iy2 <= iy1:
-        return 0
-    return (ix2 - ix1) * (iy2 - iy1)
-
-
 def _nearest_wrapped_offset(delta: int, span: int) -> int:
     """Normalize an offset to the nearest equivalent position in span-sized steps."""
     if span <= 0:
@@ -195,11 +470,24 @@ def _maybe_reanchor_crt_rect(
     if dw <= 0 or dh <= 0:
         return rect
 
-    current_overlap = _intersection_area(rect, crt_display_rect)
+    # Overlap with the CRT bounds, inlined for the current and candidate rects.
+    dx2, dy2 = dx + dw, dy + dh
+    # Fully inside the CRT already: overlap is the whole rect, so no
+    # re-anchored candidate can beat it.
+    if dx <= rx and rx + rw <= dx2 and dy <= ry and ry + rh <= dy2:
+        return rect
+    current_overlap = (
+        max(0, min(rx + rw, dx2) - max(rx, dx))
+        * max(0, min(ry + rh, dy2) - max(ry, dy))
+    )
     rel_x = _nearest_wrapped_offset(rx - dx, dw)
     rel_y = _nearest_wrapped_offset(ry - dy, dh)
     candidate = (dx + rel_x, dy + rel_y, rw, rh)
-    candidate_overlap = _intersection_area(candidate, crt_display_rect)
+    cx, cy = candidate[0], candidate[1]
+    candidate_overlap = (
+        max(0, min(cx + rw, dx2) - max(cx, dx))
+        * max(0, min(cy + rh, dy2) - max(cy, dy))
+    )
 
     if candidate_overlap > current_overlap:
         print(
@@ -240,58 +528,73 @@ def move_moonlight_to_crt(
         else:
             x, y, w, h = rect
 
-    for _ in range(30):
-        hwnd = find_moonlight_window(moonlight_dir)
-        if hwnd:
-            try:
-                move_window(hwnd, x, y, w, h, strip_caption=False)
-                print(
-                    f"[re-stack] Moonlight moved to CRT display: "
-                    f"x={x}, y={y}, w={w}, h={h}"
-                )
-                return True
-            except Exception as e:
-                print(f"[re-stack] Failed moving Moonlight window: {e}")
-                return False
-        time.sleep(0.5)
+    hwnd = _poll_with_backoff(lambda: find_moonlight_window(moonlight_dir), 15.0)
+    if hwnd:
+        try:
+            move_window(hwnd, x, y, w, h, strip_caption=False)
+            print(
+                f"[re-stack] Moonlight moved to CRT display: "
+                f"x={x}, y={y}, w={w}, h={h}"
+            )
+            return True
+        except Exception as e:
+            print(f"[re-stack] Failed moving Moonlight window: {e}")
+            return False
 
     print("[re-stack] Could not find Moonlight window to move.")
     return False
 
 
 def move_moonlight_to_internal(
-    internal_tokens: List[str],
+    internal_tokens: Sequence[str],
     moonlight_dir: str,
     idle_rect: Optional[Tuple[int, int, int, int]] = None,
+    fallback_rects: Sequence[Optional[Tuple[int, int, int, int]]] = (),
 ) -> bool:
     """Move the Moonlight window back to the idle (internal display) position.
 
     Resolution order:
       1. idle_rect from re_stack_config.json moonlight.idle_rect (if set)
       2. Full bounds of the internal display via display enumeration
+
+    fallback_rects are tried in order after idle_rect when a placement can't
+    be resolved or the move fails (None means the live internal display
+    bounds).  The Moonlight window and the display bounds are looked up at
+    most once across all attempts.
     """
-    if idle_rect is not None:
-        x, y, w, h = idle_rect
-        print(f"[re-stack] Using configured idle rect: x={x}, y={y}, w={w}, h={h}")
-    else:
-        rect = get_crt_display_rect(internal_tokens)
-        if rect is None:
-            print("[re-stack] Could not detect internal display bounds; Moonlight not moved.")
-            return False
-        x, y, w, h = rect
-    for _ in range(6):
-        hwnd = find_moonlight_window(moonlight_dir)
-        if hwnd:
-            try:
-                move_window(hwnd, x, y, w, h, strip_caption=False)
-                print(
-                    f"[re-stack] Moonlight moved to internal display: "
-                    f"x={x}, y={y}, w={w}, h={h}"
-                )
-                return True
-            except Exception as e:
-                print(f"[re-stack] Failed moving Moonlight to internal display: {e}")
+    hwnd: Optional[int] = None
+    live_rect: Optional[Tuple[int, int, int, int]] = None
+    live_resolved = False
+    tried: List[Optional[Tuple[int, int, int, int]]] = []
+    for candidate in (idle_rect, *fallback_rects):
+        if candidate in tried:
+            continue
+        if tried:
+            print("[re-stack] Trying next Moonlight internal placement fallback...")
+        tried.append(candidate)
+        if candidate is not None:
+            x, y, w, h = candidate
+            print(f"[re-stack] Using configured idle rect: x={x}, y={y}, w={w}, h={h}")
+        else:
+            if not live_resolved:
+                live_rect = get_crt_display_rect(internal_tokens)
+                live_resolved = True
+            if live_rect is None:
+                print("[re-stack] Could not detect internal display bounds; Moonlight not moved.")
+                continue
+            x, y, w, h = live_rect
+        if hwnd is None:
+            hwnd = _poll_with_backoff(lambda: find_moonlight_window(moonlight_dir), 3.0)
+            if not hwnd:
+                print("[re-stack] Could not find Moonlight window to move to internal display.")
                 return False
-        time.sleep(0.5)
-    print("[re-stack] Could not find Moonlight window to move to internal display.")
+        try:
+            move_window(hwnd, x, y, w, h, strip_caption=False)
+            print(
+                f"[re-stack] Moonlight moved to internal display: "
+                f"x={x}, y={y}, w={w}, h={h}"
+            )
+            return True
+        except Exception as e:
+            print(f"[re-stack] Failed moving Moonlight to internal display: {e}")
     return False
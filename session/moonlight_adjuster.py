@@ -2,6 +2,7 @@
 
 import json
 import msvcrt
+import os
 
 import win32gui
 
@@ -9,24 +10,44 @@ from session.re_config import RE_STACK_CONFIG_PATH, MOONLIGHT_DIR
 from session.window_utils import find_window, get_rect, move_window
 
 
+# Config as last read or written by write_moonlight_rect, keyed by the file's
+# (mtime_ns, size) so repeated saves from the adjuster skip the re-read while
+# any outside edit still forces one.
+_cfg_cache: dict = {"key": None, "cfg": None}
+
+
+def _stat_key(path: str):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
 def write_moonlight_rect(config_key: str, x: int, y: int, w: int, h: int) -> bool:
     """Write a Moonlight rect to re_stack_config.json. Returns True on success."""
     try:
-        with open(RE_STACK_CONFIG_PATH, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+        key = _stat_key(RE_STACK_CONFIG_PATH)
+        cfg = _cfg_cache["cfg"]
+        if cfg is None or _cfg_cache["key"] != key:
+            with open(RE_STACK_CONFIG_PATH, "r", encoding="utf-8") as f:
+                cfg = json.load(f)
     except Exception as e:
         print(f"[re-stack] Could not read config: {e}")
         return False
+    _cfg_cache["cfg"] = None  # re-read if the write below fails part-way
     if "moonlight" not in cfg:
         cfg["moonlight"] = {}
     cfg["moonlight"][config_key] = {"x": x, "y": y, "w": w, "h": h}
     try:
         with open(RE_STACK_CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(cfg, f, indent=2)
-        return True
     except Exception as e:
         print(f"[re-stack] Could not write config: {e}")
         return False
+    try:
+        _cfg_cache["key"] = _stat_key(RE_STACK_CONFIG_PATH)
+        _cfg_cache["cfg"] = cfg
+    except OSError:
+        pass
+    return True
 
 
 def capture_moonlight_pos(config_key: str) -> int:
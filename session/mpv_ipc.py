@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import codecs
+import collections
+import itertools
 import json
+import random
+import re
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 _HAS_WIN32 = False
 try:
     import pywintypes
+    import win32event
     import win32file
     import win32pipe
     _HAS_WIN32 = True
@@ -18,6 +24,51 @@ except ImportError:
 
 PIPE_NAME = r"\\.\pipe\crt-mpv-ipc"
 
+# mpv (the pipe server) picks the kernel buffer sizes; what the client controls
+# is how much it asks for per ReadFile, so ask for a whole burst at once.
+_READ_CHUNK = 65536
+_ERROR_MORE_DATA = 234
+_ERROR_OPERATION_ABORTED = 995
+_ERROR_NOT_FOUND = 1168
+
+_DECODER = json.JSONDecoder()
+# Built once: json.dumps() with non-default separators constructs a new
+# encoder on every call.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_WS = re.compile(r"[ \t\r\n]*")
+_COMPACT_AT = 1 << 16
+
+
+def _canned(cmd: list) -> tuple:
+    """Pre-encode a constant command: (args, write-only wire, duplex template)."""
+    body = _ENCODER.encode(cmd)
+    return (
+        cmd,
+        ('{"command":%s}\n' % body).encode("utf-8"),
+        ('{"command":%s,"request_id":%%d}\n' % body).encode("utf-8"),
+    )
+
+
+def _encode_cmd(payload: dict) -> bytes:
+    """Encode one request as compact JSON plus the terminating newline."""
+    return (_ENCODER.encode(payload) + "\n").encode("utf-8")
+
+
+# Hotkey commands whose payload never changes; encoded once at import.
+_CANNED = {
+    "toggle_pause": _canned(["cycle", "pause"]),
+    "toggle_mute": _canned(["cycle", "mute"]),
+    "quit": _canned(["quit"]),
+    "playlist_next": _canned(["playlist-next"]),
+    "playlist_prev": _canned(["playlist-prev"]),
+    "video-zoom=0": _canned(["set_property", "video-zoom", 0]),
+    "video-pan-x=0": _canned(["set_property", "video-pan-x", 0]),
+    "video-pan-y=0": _canned(["set_property", "video-pan-y", 0]),
+}
+
+_ZOOM_PAN_PROPS = ("video-zoom", "video-pan-x", "video-pan-y")
+_RESET_ZOOM_PAN_WIRE = b"".join(_CANNED[name + "=0"][1] for name in _ZOOM_PAN_PROPS)
+
 
 class MpvIpc:
     """IPC client for mpv named-pipe JSON protocol.
@@ -32,16 +83,26 @@ class MpvIpc:
     """
 
     _MAX_PENDING = 128
+    _MAX_PROPS = 256
 
     def __init__(self, use_duplex: bool = False):
         self._handle = None
-        self._prop_cache: Dict[str, Any] = {}
-        self._pending_by_id: Dict[int, dict] = {}
-        self._read_buffer = b""
-        self._next_request_id = 1
+        self._prop_cache: collections.OrderedDict[str, Any] = collections.OrderedDict()
+        self._pending_by_id: collections.OrderedDict[int, dict] = collections.OrderedDict()
+        # Decoded receive stream plus a cursor; consumed text is only sliced
+        # off once it grows past _COMPACT_AT.
+        self._read_str = ""
+        self._read_pos = 0
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._id_counter = itertools.count(1)
         self._io_lock = threading.Lock()
         self._requested_duplex = bool(use_duplex)
         self._duplex_active = False
+        # Duplex handles are opened FILE_FLAG_OVERLAPPED; these are reused
+        # for every read/write on them (created in connect()).
+        self._read_ov = None
+        self._write_ov = None
+        self._read_buf = None
 
     @property
     def mode(self) -> str:
@@ -52,53 +113,73 @@ class MpvIpc:
 
         If duplex is requested, we try R/W first and gracefully fall back to
         write-only if unavailable so controls remain usable.
+
+        Retries back off exponentially from 10 ms up to `delay`, within the
+        same overall budget as `retries` fixed sleeps of `delay`, so a pipe
+        that appears shortly after mpv starts is picked up almost at once.
         """
         if not _HAS_WIN32:
             return False
-        for attempt in range(retries):
+        deadline = time.monotonic() + max(0, retries - 1) * delay
+        attempt = 0
+        while True:
             try:
-                if self._requested_duplex:
-                    try:
-                        self._handle = win32file.CreateFile(
-                            PIPE_NAME,
-                            win32file.GENERIC_READ | win32file.GENERIC_WRITE,
-                            0,
-                            None,
-                            win32file.OPEN_EXISTING,
-                            0,
-                            None,
-                        )
-                        self._duplex_active = True
-                        return True
-                    except Exception:
-                        # Fallback keeps controls working even if duplex isn't supported.
-                        self._handle = win32file.CreateFile(
-                            PIPE_NAME,
-                            win32file.GENERIC_WRITE,
-                            0,
-                            None,
-                            win32file.OPEN_EXISTING,
-                            0,
-                            None,
-                        )
-                        self._duplex_active = False
-                        return True
+                self._open_pipe()
+                self._bind_mode()
+                return True
+            except pywintypes.error:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            backoff = min(delay, 0.01 * (2 ** attempt)) + random.uniform(0, 0.005)
+            time.sleep(min(remaining, backoff))
+            attempt += 1
 
+    def _open_pipe(self) -> None:
+        """One connection attempt; raises pywintypes.error if the pipe isn't up."""
+        if self._requested_duplex:
+            try:
                 self._handle = win32file.CreateFile(
                     PIPE_NAME,
-                    win32file.GENERIC_WRITE,
+                    win32file.GENERIC_READ | win32file.GENERIC_WRITE,
                     0,
                     None,
                     win32file.OPEN_EXISTING,
-                    0,
+                    win32file.FILE_FLAG_OVERLAPPED,
                     None,
                 )
-                self._duplex_active = False
-                return True
-            except pywintypes.error:
-                if attempt < retries - 1:
-                    time.sleep(delay)
-        return False
+                try:
+                    win32pipe.SetNamedPipeHandleState(
+                        self._handle, win32pipe.PIPE_READMODE_BYTE, None, None
+                    )
+                except pywintypes.error:
+                    pass  # already byte mode, or the server refuses; both fine
+                self._init_overlapped()
+                self._duplex_active = True
+                return
+            except Exception:
+                # Fallback keeps controls working even if duplex isn't supported.
+                pass
+
+        self._handle = win32file.CreateFile(
+            PIPE_NAME,
+            win32file.GENERIC_WRITE,
+            0,
+            None,
+            win32file.OPEN_EXISTING,
+            0,
+            None,
+        )
+        self._duplex_active = False
+
+    def _init_overlapped(self) -> None:
+        if self._read_ov is None:
+            self._read_ov = pywintypes.OVERLAPPED()
+            self._read_ov.hEvent = win32event.CreateEvent(None, True, False, None)
+            self._write_ov = pywintypes.OVERLAPPED()
+            self._write_ov.hEvent = win32event.CreateEvent(None, True, False, None)
+            self._read_buf = win32file.AllocateReadBuffer(_READ_CHUNK)
 
     def close(self) -> None:
         if self._handle is not None:
@@ -108,7 +189,16 @@ class MpvIpc:
                 pass
             self._handle = None
         self._pending_by_id.clear()
-        self._read_buffer = b""
+        self._read_str = ""
+        self._read_pos = 0
+        self._utf8.reset()
+        for ov in (self._read_ov, self._write_ov):
+            if ov is not None:
+                try:
+                    win32file.CloseHandle(ov.hEvent)
+                except Exception:
+                    pass
+        self._read_ov = self._write_ov = self._read_buf = None
 
     def __enter__(self):
         return self
@@ -125,140 +215,263 @@ class MpvIpc:
         self._handle = None
 
     def _next_id(self) -> int:
-        rid = self._next_request_id
-        self._next_request_id += 1
-        if self._next_request_id > 2_000_000_000:
-            self._next_request_id = 1
-        return rid
+        # next() on itertools.count is atomic under the GIL, so ids stay
+        # unique even though callers allocate them outside _io_lock.
+        return (next(self._id_counter) & 0x7FFFFFFF) or 1
+
+    def _cache_prop(self, name: str, value: Any) -> None:
+        self._prop_cache[name] = value
+        self._prop_cache.move_to_end(name)
+        if len(self._prop_cache) > self._MAX_PROPS:
+            self._prop_cache.popitem(last=False)  # least recently written
 
     def _store_pending(self, rid: int, obj: dict) -> None:
         self._pending_by_id[rid] = obj
+        self._pending_by_id.move_to_end(rid)
         if len(self._pending_by_id) > self._MAX_PENDING:
-            # Drop oldest inserted key by dict order.
-            oldest = next(iter(self._pending_by_id))
-            self._pending_by_id.pop(oldest, None)
+            self._pending_by_id.popitem(last=False)  # drop the oldest
 
     def _drain_events(self, obj: dict) -> None:
         # Track property-change events as optional cache hints.
+        if not isinstance(obj, dict):
+            return
+        if obj.get("event") == "property-change":
+            name = obj.get("name")
+            if name:
+                try:
+                    self._cache_prop(name, obj.get("data"))
+                except TypeError:
+                    pass  # unhashable "name" from a malformed event
+
+    def _read_chunk(self, timeout: float) -> Optional[bytes]:
+        """One overlapped ReadFile bounded by timeout (duplex handles only).
+
+        Returns the bytes read, b"" on timeout, or None after invalidating the
+        handle on error/EOF.  A timed-out read is cancelled and waited out so
+        the shared buffer is never left in use by the kernel.
+        """
+        ov = self._read_ov
+        win32event.ResetEvent(ov.hEvent)
         try:
-            if obj.get("event") == "property-change":
-                name = obj.get("name")
-                if name:
-                    self._prop_cache[name] = obj.get("data")
-        except Exception:
-            pass
+            win32file.ReadFile(self._handle, self._read_buf, ov)
+        except pywintypes.error:
+            self._invalidate()
+            return None
 
-    def _read_line(self, timeout: float) -> Optional[str]:
-        if self._handle is None or not _HAS_WIN32:
+        rc = win32event.WaitForSingleObject(ov.hEvent, max(0, int(timeout * 1000)))
+        if rc == win32event.WAIT_TIMEOUT:
+            try:
+                # The read was issued by this thread, so CancelIo covers it.
+                win32file.CancelIo(self._handle)
+            except pywintypes.error as exc:
+                if exc.winerror != _ERROR_NOT_FOUND:  # not found = already completed
+                    self._invalidate()
+                    return None
+        try:
+            n = win32file.GetOverlappedResult(self._handle, ov, True)
+        except pywintypes.error as exc:
+            if exc.winerror == _ERROR_OPERATION_ABORTED:
+                return b""
+            if exc.winerror == _ERROR_MORE_DATA:
+                return bytes(self._read_buf)
+            self._invalidate()
             return None
-        deadline = time.monotonic() + max(0.0, timeout)
+        if n == 0:
+            if rc == win32event.WAIT_TIMEOUT:
+                return b""
+            self._invalidate()  # EOF: mpv closed the pipe
+            return None
+        return bytes(self._read_buf[:n])
 
-        while time.monotonic() < deadline:
-            if b"\n" in self._read_buffer:
-                line, self._read_buffer = self._read_buffer.split(b"\n", 1)
-                return line.decode("utf-8", errors="ignore")
+    def _read_message(self, deadline: float) -> Optional[dict]:
+        """Return the next JSON object from the pipe, or None on timeout/error.
 
-            try:
-                avail = win32pipe.PeekNamedPipe(self._handle, 0)[1]
-            except Exception:
-                self._invalidate()
-                return None
+        deadline is an absolute time.monotonic() value shared by the caller's
+        whole request, so the clock is read once per ReadFile, not per call.
+
+        mpv terminates every message with a newline, so a complete message is
+        available once a newline follows the cursor; it is parsed in place with
+        raw_decode.  Unparseable lines are skipped.
+        """
+        if self._handle is None or not _HAS_WIN32 or self._read_ov is None:
+            return None
 
-            if avail <= 0:
-                time.sleep(0.01)
+        while True:
+            buf = self._read_str
+            pos = _WS.match(buf, self._read_pos).end()
+            nl = buf.find("\n", pos)
+            if nl != -1:
+                try:
+                    obj, end = _DECODER.raw_decode(buf, pos)
+                except ValueError:
+                    obj, end = None, nl + 1
+                if end >= len(buf):
+                    self._read_str, self._read_pos = "", 0
+                elif end > _COMPACT_AT:
+                    self._read_str, self._read_pos = buf[end:], 0
+                else:
+                    self._read_pos = end
+                if isinstance(obj, dict):
+                    return obj
                 continue
 
-            try:
-                _, chunk = win32file.ReadFile(self._handle, min(4096, max(1, avail)))
-                if not chunk:
-                    self._invalidate()
-                    return None
-                self._read_buffer += chunk
-            except Exception:
-                self._invalidate()
+            if pos >= len(buf):
+                self._read_str, self._read_pos = "", 0
+            else:
+                self._read_pos = pos
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return None
-        return None
+            chunk = self._read_chunk(remaining)
+            if chunk is None:
+                return None
+            if chunk:
+                self._read_str += self._utf8.decode(chunk)
 
-    def _send_write_only(self, cmd_args: list) -> bool:
+    def _write_overlapped(self, data: bytes) -> None:
+        ov = self._write_ov
+        win32event.ResetEvent(ov.hEvent)
+        win32file.WriteFile(self._handle, data, ov)
+        win32file.GetOverlappedResult(self._handle, ov, True)
+
+    def _send_raw(self, wire: bytes) -> bool:
         if self._handle is None or not _HAS_WIN32:
             return False
         try:
-            payload = json.dumps({"command": cmd_args}) + "\n"
-            win32file.WriteFile(self._handle, payload.encode("utf-8"))
+            win32file.WriteFile(self._handle, wire)
             return True
         except Exception:
             self._invalidate()
             return False
 
-    def _send_request(self, cmd_args: list, timeout: float) -> Optional[dict]:
-        """Send request and wait for matching request_id response (duplex only)."""
-        if not self._duplex_active or self._handle is None or not _HAS_WIN32:
-            return None
+    def _send_write_only(self, cmd_args: list) -> bool:
+        return self._send_raw(_encode_cmd({"command": cmd_args}))
 
-        rid = self._next_id()
-        payload = {"command": cmd_args, "request_id": rid}
+    def _exchange(self, wire: bytes, rids: List[int], timeout: float) -> Dict[int, dict]:
+        """Write wire in one call and collect the responses for rids (duplex only).
 
+        Returns whichever responses arrived before the timeout, keyed by id.
+        """
+        found: Dict[int, dict] = {}
         with self._io_lock:
             # A matching response may have been buffered earlier.
-            cached = self._pending_by_id.pop(rid, None)
-            if cached is not None:
-                return cached
+            for rid in rids:
+                cached = self._pending_by_id.pop(rid, None)
+                if cached is not None:
+                    found[rid] = cached
+            if len(found) == len(rids):
+                return found
 
             try:
-                wire = json.dumps(payload) + "\n"
-                win32file.WriteFile(self._handle, wire.encode("utf-8"))
+                self._write_overlapped(wire)
             except Exception:
                 self._invalidate()
-                return None
+                return found
 
             deadline = time.monotonic() + max(0.0, timeout)
-            while time.monotonic() < deadline:
-                line = self._read_line(deadline - time.monotonic())
-                if line is None:
-                    return None
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except Exception:
-                    continue
-
+            if len(rids) == 1:
+                # Common case: a single request whose reply is the next
+                # message on the pipe.
+                obj = self._read_message(deadline)
+                if obj is None:
+                    return found
+                if obj.get("request_id") == rids[0]:
+                    found[rids[0]] = obj
+                    return found
+                self._route_unmatched(obj)
+
+            wanted = set(rids).difference(found)
+            while wanted:
+                obj = self._read_message(deadline)
+                if obj is None:
+                    break
                 msg_rid = obj.get("request_id")
-                if isinstance(msg_rid, int):
-                    if msg_rid == rid:
-                        return obj
-                    self._store_pending(msg_rid, obj)
-                    continue
-
-                # Async event/no request_id.
-                self._drain_events(obj)
+                if msg_rid in wanted:
+                    wanted.discard(msg_rid)
+                    found[msg_rid] = obj
+                else:
+                    self._route_unmatched(obj)
+        return found
+
+    def _route_unmatched(self, obj: dict) -> None:
+        """Stash a reply for another request, or apply an async event."""
+        msg_rid = obj.get("request_id")
+        if isinstance(msg_rid, int):
+            self._store_pending(msg_rid, obj)
+        else:
+            self._drain_events(obj)
+
+    def _send_request(
+        self, cmd_args: list, timeout: float, wire_template: Optional[bytes] = None
+    ) -> Optional[dict]:
+        """Send request and wait for matching request_id response (duplex only).
+
+        wire_template, when given, is the pre-encoded request with a %d slot
+        for the request id (see _CANNED).
+        """
+        if not self._duplex_active or self._handle is None or not _HAS_WIN32:
             return None
 
-    def _command(self, *cmd_args, timeout: float = 0.20) -> bool:
-        cmd = list(cmd_args)
-        if self._duplex_active:
-            resp = self._send_request(cmd, timeout)
-            if not resp:
-                return False
-            return resp.get("error") == "success"
-        return self._send_write_only(cmd)
+        rid = self._next_id()
+        if wire_template is not None:
+            wire = wire_template % rid
+        else:
+            wire = _encode_cmd({"command": cmd_args, "request_id": rid})
+        return self._exchange(wire, [rid], timeout).get(rid)
+
+    # The mode is fixed once connect() succeeds, so the send entry points
+    # are bound to their mode-specific variant there (_bind_mode) instead of
+    # branching on _duplex_active per call.  Class defaults are write-only.
+
+    def _command_write_only(self, *cmd_args, timeout: float = 0.20) -> bool:
+        return self._send_write_only(list(cmd_args))
+
+    def _command_duplex(self, *cmd_args, timeout: float = 0.20) -> bool:
+        resp = self._send_request(list(cmd_args), timeout)
+        if not resp:
+            return False
+        return resp.get("error") == "success"
 
-    def get_property(self, name: str, timeout: float = 0.20):
-        if self._duplex_active:
-            resp = self._send_request(["get_property", name], timeout)
-            if resp and resp.get("error") == "success":
-                value = resp.get("data")
-                self._prop_cache[name] = value
-                return value
-            return None
+    def _command_canned_write_only(self, key: str, timeout: float = 0.20) -> bool:
+        return self._send_raw(_CANNED[key][1])
+
+    def _command_canned_duplex(self, key: str, timeout: float = 0.20) -> bool:
+        cmd, _, template = _CANNED[key]
+        resp = self._send_request(cmd, timeout, template)
+        if not resp:
+            return False
+        return resp.get("error") == "success"
+
+    def _get_property_write_only(self, name: str, timeout: float = 0.20):
         # Legacy write-only behavior: cache only.
         return self._prop_cache.get(name)
 
+    def _get_property_duplex(self, name: str, timeout: float = 0.20):
+        resp = self._send_request(["get_property", name], timeout)
+        if resp and resp.get("error") == "success":
+            value = resp.get("data")
+            self._cache_prop(name, value)
+            return value
+        return None
+
+    _command = _command_write_only
+    _command_canned = _command_canned_write_only
+    get_property = _get_property_write_only
+
+    def _bind_mode(self) -> None:
+        if self._duplex_active:
+            self._command = self._command_duplex
+            self._command_canned = self._command_canned_duplex
+            self.get_property = self._get_property_duplex
+        else:
+            self._command = self._command_write_only
+            self._command_canned = self._command_canned_write_only
+            self.get_property = self._get_property_write_only
+
     # ---- Public command methods ----
 
     def toggle_pause(self) -> bool:
-        return self._command("cycle", "pause")
+        return self._command_canned("toggle_pause")
 
     def seek(self, seconds: int) -> bool:
         return self._command("seek", seconds, "relative")
@@ -270,24 +483,37 @@ class MpvIpc:
         return self._command("add", "volume", delta)
 
     def toggle_mute(self) -> bool:
-        return self._command("cycle", "mute")
+        return self._command_canned("toggle_mute")
 
     def quit(self) -> bool:
-        return self._command("quit")
+        return self._command_canned("quit")
 
     def set_property(self, name: str, value) -> bool:
         result = self._command("set_property", name, value)
         if result:
-            self._prop_cache[name] = value
+            self._cache_prop(name, value)
         return result
 
-    def reset_zoom_pan(self) -> None:
-        self.set_property("video-zoom", 0)
-        self.set_property("video-pan-x", 0)
-        self.set_property("video-pan-y", 0)
+    def reset_zoom_pan(self, timeout: float = 0.20) -> None:
+        """Zero zoom and pan with all three writes in a single pipe message."""
+        if self._duplex_active:
+            if self._handle is None:
+                return
+            rids = [self._next_id() for _ in _ZOOM_PAN_PROPS]
+            wire = b"".join(
+                _CANNED[name + "=0"][2] % rid for name, rid in zip(_ZOOM_PAN_PROPS, rids)
+            )
+            resps = self._exchange(wire, rids, timeout)
+            for name, rid in zip(_ZOOM_PAN_PROPS, rids):
+                resp = resps.get(rid)
+                if resp and resp.get("error") == "success":
+                    self._cache_prop(name, 0)
+        elif self._send_raw(_RESET_ZOOM_PAN_WIRE):
+            for name in _ZOOM_PAN_PROPS:
+                self._cache_prop(name, 0)
 
     def playlist_next(self) -> bool:
-        return self._command("playlist-next")
+        return self._command_canned("playlist_next")
 
     def playlist_prev(self) -> bool:
-        return self._command("playlist-prev")
+        return self._command_canned("playlist_prev")
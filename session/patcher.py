@@ -1,8 +1,9 @@
 """Patch coordinator.
 
 apply_all(patches) -> backup_dir
-    Collects all target file paths, backs them up, then applies each patch in
-    order.  On any failure: restores from backup, cleans up the backup dir,
+    Collects all target file paths, backs them up, then applies the patches.
+    Patches on disjoint files run concurrently; patches sharing a file keep
+    their relative order.  On any failure: restores from backup, cleans up the backup dir,
     and re-raises the exception so the caller can report it.
 
 restore_all(backup_dir) -> bool
@@ -11,7 +12,8 @@ restore_all(backup_dir) -> bool
     each failed file is logged with manual copy instructions; cleanup still
     runs.
 """
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Set
 
 from session import backup
 from session.patches import launchbox as lb_patch
@@ -22,27 +24,68 @@ from session.patches import retroarch as ra_patch
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_MAX_PATCH_WORKERS = 4
+
+
+def _patch_paths(patch: dict) -> List[str]:
+    """Return the files a single patch will touch."""
+    t = patch.get("type")
+    if t in ("retroarch_cfg", "launchbox_emulator"):
+        return [patch["path"]]
+    if t == "launchbox_settings":
+        return [patch["bigbox_path"], patch["settings_path"]]
+    return []
+
+
 def _collect_paths(patches: List[dict]) -> List[str]:
     """Return an ordered, deduplicated list of all files a patch list will touch."""
     paths: List[str] = []
     seen: set = set()
+    for patch in patches:
+        for p in _patch_paths(patch):
+            if p and p not in seen:
+                seen.add(p)
+                paths.append(p)
+    return paths
 
-    def add(p: str) -> None:
-        if p and p not in seen:
-            seen.add(p)
-            paths.append(p)
 
-    for patch in patches:
-        t = patch.get("type")
-        if t == "retroarch_cfg":
-            add(patch["path"])
-        elif t == "launchbox_emulator":
-            add(patch["path"])
-        elif t == "launchbox_settings":
-            add(patch["bigbox_path"])
-            add(patch["settings_path"])
+def _waves(patches: List[dict]) -> List[List[dict]]:
+    """Group patches into ordered waves whose members touch disjoint files.
 
-    return paths
+    Each patch joins the wave after the last one it shares a file with, so
+    patches on the same file still apply in manifest order.
+    """
+    waves: List[List[dict]] = []
+    wave_paths: List[Set[str]] = []
+    for patch in patches:
+        paths = set(_patch_paths(patch))
+        idx = 0
+        for i in range(len(waves) - 1, -1, -1):
+            if wave_paths[i] & paths:
+                idx = i + 1
+                break
+        if idx == len(waves):
+            waves.append([])
+            wave_paths.append(set())
+        waves[idx].append(patch)
+        wave_paths[idx] |= paths
+    return waves
+
+
+def _apply_wave(wave: List[dict]) -> None:
+    """Apply one wave; raise the first failure in manifest order."""
+    if len(wave) == 1:
+        _apply_patch(wave[0])
+        return
+    with ThreadPoolExecutor(max_workers=min(_MAX_PATCH_WORKERS, len(wave))) as pool:
+        futures = [pool.submit(_apply_patch, patch) for patch in wave]
+        try:
+            for fut in futures:
+                fut.result()
+        except Exception:
+            for fut in futures:
+                fut.cancel()
+            raise
 
 
 def _apply_patch(patch: dict) -> None:
@@ -67,7 +110,7 @@ def _apply_patch(patch: dict) -> None:
 # ---------------------------------------------------------------------------
 
 def apply_all(patches: List[dict]) -> str:
-    """Backup all patch targets and apply all patches in order.
+    """Backup all patch targets and apply all patches.
 
     Returns the backup directory path (caller must eventually call
     restore_all() or pass it to backup.cleanup()).
@@ -78,8 +121,8 @@ def apply_all(patches: List[dict]) -> str:
     paths = _collect_paths(patches)
     backup_dir = backup.backup_files(paths)
     try:
-        for patch in patches:
-            _apply_patch(patch)
+        for wave in _waves(patches):
+            _apply_wave(wave)
     except Exception:
         backup.restore_files(backup_dir)
         backup.cleanup(backup_dir)
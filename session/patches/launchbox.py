@@ -12,39 +12,74 @@ Two entry points:
 
 Both functions write the file back using the same encoding and declaration that
 ElementTree uses (UTF-8 with XML declaration), which matches what option 2
-currently produces.
+currently produces.  A file is only rewritten when a value actually changed,
+and the write goes through a temp file + os.replace.
 """
+import os
 import re
 import xml.etree.ElementTree as ET
-from typing import Dict, List
+from typing import Dict, List, Optional, Pattern
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _set_text(parent: ET.Element, tag: str, value: str) -> None:
-    """Set or create a child element's text."""
+def _set_text(parent: ET.Element, tag: str, value: str) -> bool:
+    """Set or create a child element's text. Returns True if anything changed."""
     node = parent.find(tag)
     if node is None:
         node = ET.SubElement(parent, tag)
+    elif node.text == value:
+        return False
     node.text = value
+    return True
 
 
 def _save_tree(tree: ET.ElementTree, path: str) -> None:
-    tree.write(path, encoding="utf-8", xml_declaration=True)
+    tmp = path + ".tmp"
+    tree.write(tmp, encoding="utf-8", xml_declaration=True)
+    os.replace(tmp, path)
 
 
-def _strip_arg_pattern(arg: str) -> str:
-    """Build a word-boundary regex pattern that matches `arg` in a command string.
+def _parse_emulators_xml(path: str):
+    """Parse Emulators.xml in one streaming pass.
 
-    Splits arg on whitespace so that multi-word args like
-    '-C Dolphin.Display.Fullscreen=True' produce a pattern that tolerates
-    any amount of whitespace between tokens.
+    Returns (tree, emulators, platforms) where the last two are the root's
+    <Emulator> and <EmulatorPlatform> children, collected as they close so
+    callers don't walk the tree again.  The whole tree is still kept because
+    write-back serializes the full document.
     """
-    tokens = arg.split()
-    escaped = r"\s+".join(re.escape(t) for t in tokens)
-    return rf"(^|\s){escaped}(?=\s|$)"
+    root = None
+    depth = 0
+    emulators: List[ET.Element] = []
+    platforms: List[ET.Element] = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            if elem.tag == "Emulator":
+                emulators.append(elem)
+            elif elem.tag == "EmulatorPlatform":
+                platforms.append(elem)
+    return ET.ElementTree(root), emulators, platforms
+
+
+def _strip_args_regex(args: List[str]) -> Optional[Pattern[str]]:
+    """Compile one word-boundary regex matching any of `args` in a command string.
+
+    Splits each arg on whitespace so that multi-word args like
+    '-C Dolphin.Display.Fullscreen=True' tolerate any amount of whitespace
+    between tokens.  Alternatives keep the configured order.
+    """
+    alts = [r"\s+".join(re.escape(t) for t in arg.split()) for arg in args if arg.split()]
+    if not alts:
+        return None
+    return re.compile(r"(^|\s)(?:" + "|".join(f"(?:{a})" for a in alts) + r")(?=\s|$)")
 
 
 # ---------------------------------------------------------------------------
@@ -62,8 +97,8 @@ def apply_emulator(path: str, emulators: List[Dict]) -> None:
         xml_fields  - dict of additional XML elements to set on the Emulator
                       node (e.g. UseStartupScreen, StartupLoadDelay)
     """
-    tree = ET.parse(path)
-    root = tree.getroot()
+    tree, emulator_nodes, platform_nodes = _parse_emulators_xml(path)
+    dirty = False
 
     # First pass: patch Emulator nodes and record their IDs.
     # title_lower -> (em_cfg dict, id_str or None)
@@ -71,7 +106,7 @@ def apply_emulator(path: str, emulators: List[Dict]) -> None:
         em["title"].lower(): (em, None) for em in emulators
     }
 
-    for emulator in root.findall("Emulator"):
+    for emulator in emulator_nodes:
         title = (emulator.findtext("Title") or "").strip().lower()
         if title not in title_map:
             continue
@@ -79,31 +114,35 @@ def apply_emulator(path: str, emulators: List[Dict]) -> None:
         em_id = (emulator.findtext("ID") or "").strip()
         title_map[title] = (em_cfg, em_id)
 
-        _set_text(emulator, "ApplicationPath", em_cfg["wrapper_bat"])
+        dirty |= _set_text(emulator, "ApplicationPath", em_cfg["wrapper_bat"])
         for field, value in em_cfg.get("xml_fields", {}).items():
-            _set_text(emulator, field, value)
+            dirty |= _set_text(emulator, field, value)
 
     # Second pass: strip fullscreen args from EmulatorPlatform CommandLine.
-    id_to_cfg: Dict[str, Dict] = {
-        em_id: em_cfg
+    id_to_strip: Dict[str, Optional[Pattern[str]]] = {
+        em_id: _strip_args_regex(em_cfg.get("strip_args", []))
         for em_cfg, em_id in title_map.values()
         if em_id is not None
     }
 
-    for platform in root.findall("EmulatorPlatform"):
+    if not id_to_strip:
+        return  # no listed emulator exists; nothing above could have changed
+
+    for platform in platform_nodes:
         em_id = (platform.findtext("Emulator") or "").strip()
-        em_cfg = id_to_cfg.get(em_id)
-        if em_cfg is None:
+        strip_re = id_to_strip.get(em_id)
+        if strip_re is None:
             continue
         cmd_node = platform.find("CommandLine")
         if cmd_node is None or cmd_node.text is None:
             continue
-        cmd = cmd_node.text
-        for arg in em_cfg.get("strip_args", []):
-            cmd = re.sub(_strip_arg_pattern(arg), r"\1", cmd).strip()
-        cmd_node.text = cmd
+        cmd = strip_re.sub(r"\1", cmd_node.text).strip()
+        if cmd != cmd_node.text:
+            cmd_node.text = cmd
+            dirty = True
 
-    _save_tree(tree, path)
+    if dirty:
+        _save_tree(tree, path)
 
 
 def apply_settings(
@@ -127,13 +166,14 @@ def apply_settings(
     settings = root.find("BigBoxSettings")
     if settings is None:
         raise RuntimeError(f"BigBoxSettings node not found in {bigbox_path}")
-    _set_text(settings, "PrimaryMonitorIndex", str(monitor_index))
+    dirty = _set_text(settings, "PrimaryMonitorIndex", str(monitor_index))
     if disable_splash_screens:
-        _set_text(settings, "ShowStartupSplashScreen", "false")
-        _set_text(settings, "ShowLoadingGameMessage", "false")
-        _set_text(settings, "UseStartupScreen", "false")
-        _set_text(settings, "HideMouseCursorOnStartupScreens", "false")
-    _save_tree(tree, bigbox_path)
+        dirty |= _set_text(settings, "ShowStartupSplashScreen", "false")
+        dirty |= _set_text(settings, "ShowLoadingGameMessage", "false")
+        dirty |= _set_text(settings, "UseStartupScreen", "false")
+        dirty |= _set_text(settings, "HideMouseCursorOnStartupScreens", "false")
+    if dirty:
+        _save_tree(tree, bigbox_path)
 
     # --- Settings.xml ---
     tree = ET.parse(settings_path)
@@ -141,8 +181,10 @@ def apply_settings(
     settings = root.find("Settings")
     if settings is None:
         raise RuntimeError(f"Settings node not found in {settings_path}")
+    dirty = False
     if disable_splash_screens:
-        _set_text(settings, "ShowLaunchBoxSplashScreen", "false")
-        _set_text(settings, "UseStartupScreen", "false")
-        _set_text(settings, "HideMouseCursorOnStartupScreens", "false")
-    _save_tree(tree, settings_path)
+        dirty |= _set_text(settings, "ShowLaunchBoxSplashScreen", "false")
+        dirty |= _set_text(settings, "UseStartupScreen", "false")
+        dirty |= _set_text(settings, "HideMouseCursorOnStartupScreens", "false")
+    if dirty:
+        _save_tree(tree, settings_path)
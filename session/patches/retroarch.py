@@ -6,6 +6,7 @@ Keys not already present in the file are appended at the end.
 
 Format: retroarch.cfg uses   key = "value"   lines (one per key).
 """
+import re
 from typing import Dict
 
 
@@ -18,26 +19,30 @@ def apply(path: str, set_values: Dict[str, str]) -> None:
                     plain strings; they will be written as  key = "value".
     """
     with open(path, "r", encoding="utf-8-sig") as f:
-        lines = f.read().splitlines()
+        text = f.read()
+    if text and not text.endswith("\n"):
+        text += "\n"
 
     seen: set = set()
-    output = []
-    for line in lines:
-        stripped = line.strip()
-        replaced = False
-        for key, value in set_values.items():
-            if stripped.startswith(f"{key} = "):
-                output.append(f'{key} = "{value}"')
-                seen.add(key)
-                replaced = True
-                break
-        if not replaced:
-            output.append(line)
+    if set_values:
+        # One pass over the whole file: a line matches when, ignoring leading
+        # whitespace, it starts with "<key> = " followed by a value.
+        pattern = re.compile(
+            r"^[^\S\n]*(" + "|".join(map(re.escape, set_values)) + r") = [^\n]*\S[^\n]*$",
+            re.MULTILINE,
+        )
+
+        def _repl(m: "re.Match[str]") -> str:
+            key = m.group(1)
+            seen.add(key)
+            return f'{key} = "{set_values[key]}"'
+
+        text = pattern.sub(_repl, text)
 
     # Append any keys that were not already in the file.
-    for key, value in set_values.items():
-        if key not in seen:
-            output.append(f'{key} = "{value}"')
+    tail = "".join(
+        f'{key} = "{value}"\n' for key, value in set_values.items() if key not in seen
+    )
 
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(output) + "\n")
+        f.write((text + tail) or "\n")
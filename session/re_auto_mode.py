@@ -1,6 +1,5 @@
 """Automatic Resident Evil stack mode (currently on hold but preserved)."""
 
-import json
 import os
 import time
 from typing import Callable, Optional
@@ -8,14 +7,16 @@ from typing import Callable, Optional
 from session.display_api import (
     current_primary_device_name,
     find_display_by_token,
+    invalidate_display_cache,
+    primary_device_name_cached_lc,
     set_display_refresh_best_effort,
     set_primary_display_verified,
 )
 from session.moonlight import (
     ensure_moonlight_running,
-    is_gameplay_window_visible,
     is_moonlight_fullscreen,
     move_moonlight_to_crt,
+    visible_title_fragments,
 )
 from session.moonlight_adjuster import adjust_moonlight
 from session.re_config import (
@@ -31,11 +32,13 @@ from session.re_config import (
     REQUIRED_DISPLAY_GROUPS,
     STOP_FLAG,
     VDD_ATTACH_TIMEOUT_SECONDS,
+    load_profile,
 )
 from session.re_game import is_re_game_running
 from session.re_preflight import ensure_required_displays
 from session.re_state import apply_re_mode_system_state
 from session.vdd import plug_vdd_and_wait
+from session.win_events import EventWaiter
 
 
 def start_stack(game: str, restore_fn: Callable[[], int]) -> int:
@@ -53,6 +56,9 @@ def start_stack(game: str, restore_fn: Callable[[], int]) -> int:
 
     interrupted = False
     state_applied = False
+    # Event wakeups are capped at 1 Hz: each tick re-runs the window, process
+    # and display checks, so events only bring a tick forward, never add more.
+    waiter = EventWaiter(min_interval=1.0)
 
     try:
         if is_re_game_running():
@@ -78,10 +84,9 @@ def start_stack(game: str, restore_fn: Callable[[], int]) -> int:
         gameplay_title: Optional[str] = None
         config_title: Optional[str] = None
         try:
-            with open(profile, "r", encoding="utf-8") as f:
-                prof_data = json.load(f)
-            gameplay_title = prof_data.get("_gameplay_title")
-            config_title = prof_data.get("_config_title")
+            record = load_profile(profile)
+            gameplay_title = record.gameplay_title
+            config_title = record.config_title
         except Exception:
             pass
 
@@ -95,35 +100,74 @@ def start_stack(game: str, restore_fn: Callable[[], int]) -> int:
         else:
             print("[re-stack] No _gameplay_title in profile; using Moonlight fullscreen detection.")
 
+        # Title fragments as visible_title_fragments() reports them.
+        gameplay_lc = gameplay_title.lower() if gameplay_title else ""
+        config_lc = config_title.lower() if config_title else ""
+
         target_display = find_display_by_token(RE_PRIMARY_DISPLAY_TOKEN)
         wanted_primary = str(target_display.get("device_name", "")).strip().lower()
         last_refresh_enforce = 0.0
+        refresh_dirty = True
+        refresh_failed = False
         moonlight_moved_to_crt = False
         moonlight_game_detected_since: Optional[float] = None
         last_detection_log = 0.0
         primary_switched = False
         game_was_running = False
 
+        # Wakes on foreground/window/display changes, with 1 s as the ceiling.
+        waiter.start()
+        # With a display-change listener the CRT refresh is only re-applied
+        # after WM_DISPLAYCHANGE or primary drift (otherwise every 5 s), and
+        # the primary name is re-read only after a change.
+        display_events = waiter.watches_display_changes()
+        # Per-tick callables bound to locals once; the loop body runs on
+        # every wakeup and otherwise re-resolves these as globals/attributes.
+        clock = time.time
+        wait = waiter.wait
+        consume_display_change = waiter.consume_display_change
+        primary_name_lc = (
+            primary_device_name_cached_lc
+            if display_events
+            else (lambda: current_primary_device_name().lower())
+        )
+        refresh_crt = set_display_refresh_best_effort
+        title_fragments = visible_title_fragments
+        game_running = is_re_game_running
         while True:
-            now = time.time()
+            now = clock()
+            if consume_display_change():
+                invalidate_display_cache()
+                refresh_dirty = True
 
             if primary_switched and wanted_primary:
-                active = current_primary_device_name().lower()
+                active = primary_name_lc()
                 if active != wanted_primary:
                     print(
                         f"[re-stack] Primary drift detected "
                         f"({active or 'UNKNOWN'} -> {wanted_primary}). Re-applying."
                     )
                     set_primary_display_verified(RE_PRIMARY_DISPLAY_TOKEN, retries=1)
+                    refresh_dirty = True
 
-            if now - last_refresh_enforce >= 5.0:
-                set_display_refresh_best_effort(CRT_DISPLAY_TOKEN, CRT_TARGET_REFRESH_HZ)
+            if display_events:
+                # Re-apply soon after a display change or drift.  A failed
+                # attempt (CRT missing, mode rejected) is not retried faster
+                # than the 5 s fallback cadence.
+                due = 1.0 if refresh_dirty else 5.0
+                if (refresh_dirty or refresh_failed) and now - last_refresh_enforce >= due:
+                    refresh_failed = not refresh_crt(CRT_DISPLAY_TOKEN, CRT_TARGET_REFRESH_HZ)
+                    refresh_dirty = False
+                    last_refresh_enforce = now
+            elif now - last_refresh_enforce >= 5.0:
+                refresh_crt(CRT_DISPLAY_TOKEN, CRT_TARGET_REFRESH_HZ)
                 last_refresh_enforce = now
 
             if not moonlight_moved_to_crt:
                 if gameplay_title:
-                    in_gameplay = is_gameplay_window_visible(gameplay_title)
-                    in_config = bool(config_title and is_gameplay_window_visible(config_title))
+                    visible = title_fragments([gameplay_lc, config_lc])
+                    in_gameplay = gameplay_lc in visible
+                    in_config = bool(config_lc and config_lc in visible)
                     detected = in_gameplay and not in_config
                 else:
                     detected = is_moonlight_fullscreen(MOONLIGHT_DIR)
@@ -140,11 +184,12 @@ def start_stack(game: str, restore_fn: Callable[[], int]) -> int:
                             "[re-stack] Gameplay confirmed; "
                             "switching primary to SudoMaker and moving Moonlight to CRT."
                         )
+                        switch_started = time.monotonic()
                         set_primary_display_verified(RE_PRIMARY_DISPLAY_TOKEN)
                         primary_switched = True
                         set_display_refresh_best_effort(CRT_DISPLAY_TOKEN, CRT_TARGET_REFRESH_HZ)
-                        print("[re-stack] Waiting 2 s for display topology to settle...")
-                        time.sleep(2.0)
+                        print("[re-stack] Waiting up to 2 s for display topology to settle...")
+                        waiter.wait_for_display_settle(switch_started, timeout=2.0)
                         if move_moonlight_to_crt(
                             REQUIRED_DISPLAY_GROUPS["crt_display"],
                             MOONLIGHT_DIR,
@@ -179,32 +224,31 @@ def start_stack(game: str, restore_fn: Callable[[], int]) -> int:
                     moonlight_game_detected_since = None
                     if now - last_detection_log >= 15.0:
                         if gameplay_title:
-                            in_gp = is_gameplay_window_visible(gameplay_title)
-                            in_cfg = bool(config_title and is_gameplay_window_visible(config_title))
                             print(
                                 f"[re-stack] Waiting for gameplay: "
-                                f"'{gameplay_title}'={'yes' if in_gp else 'no'}"
-                                + (f", '{config_title}'={'yes (blocking)' if in_cfg else 'no'}"
+                                f"'{gameplay_title}'={'yes' if in_gameplay else 'no'}"
+                                + (f", '{config_title}'={'yes (blocking)' if in_config else 'no'}"
                                    if config_title else "")
                             )
                         else:
                             print("[re-stack] Waiting for Moonlight fullscreen...")
                         last_detection_log = now
             else:
-                is_running = is_re_game_running()
+                is_running = game_running()
                 if is_running:
                     game_was_running = True
                 elif game_was_running:
                     print("[re-stack] RE game has exited. Restoring system state...")
                     break
 
-            time.sleep(1.0)
+            wait(1.0)
 
     except KeyboardInterrupt:
         interrupted = True
         print("[re-stack] Ctrl+C detected. Restoring system state...")
 
     finally:
+        waiter.close()
         if state_applied:
             restore_rc = restore_fn()
             if restore_rc != 0:
@@ -5,7 +5,10 @@ No imports from other session/ modules — purely stdlib + JSON.
 
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+import types
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 STOP_FLAG = os.path.join(PROJECT_ROOT, "wrapper_stop_enforce.flag")
@@ -64,14 +67,17 @@ CRT_TARGET_REFRESH_HZ: int = int(_display_cfg.get("crt_target_refresh_hz", 60))
 RESTORE_PRIMARY_DISPLAY_TOKEN: str = _display_cfg.get(
     "restore_primary_token", "Intel(R) UHD Graphics"
 )
-REQUIRED_DISPLAY_GROUPS: Dict[str, List[str]] = _display_cfg.get(
-    "required_groups",
-    {
-        "internal_display": ["Internal Display", "Intel(R) UHD Graphics"],
-        "crt_display": ["CP-1262HE", "NVIDIA GeForce RTX 4090 Laptop GPU"],
-        "moonlight_display": ["SudoMaker Virtual Display"],
-    },
-)
+_default_display_groups = {
+    "internal_display": ["Internal Display", "Intel(R) UHD Graphics"],
+    "crt_display": ["CP-1262HE", "NVIDIA GeForce RTX 4090 Laptop GPU"],
+    "moonlight_display": ["SudoMaker Virtual Display"],
+}
+# Read-only views: tuple token lists inside a mapping proxy, so callers can't
+# mutate shared config and the values are hashable (usable as cache keys).
+REQUIRED_DISPLAY_GROUPS: Mapping[str, Tuple[str, ...]] = types.MappingProxyType({
+    k: tuple(v)
+    for k, v in _display_cfg.get("required_groups", _default_display_groups).items()
+})
 
 RE_AUDIO_DEVICE_TOKEN: str = _audio_cfg.get(
     "re_device_token", "CP-1262HE (NVIDIA High Definition Audio)"
@@ -85,7 +91,66 @@ _default_profiles = {
     "re2": "integrations/launchbox/wrapper/profiles/re2-gog.json",
     "re3": "integrations/launchbox/wrapper/profiles/re3-gog.json",
 }
-GAME_PROFILES: Dict[str, str] = {
+GAME_PROFILES: Mapping[str, str] = types.MappingProxyType({
     k: (v if os.path.isabs(v) else os.path.join(PROJECT_ROOT, v))
     for k, v in (_profiles_cfg or _default_profiles).items()
-}
+})
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    """The fields of a wrapper game profile that the RE stack reads."""
+
+    profile_path: str
+    game_dir: str
+    game_exe: str
+    process_names: Tuple[str, ...]  # lowercase
+    gameplay_title: Optional[str]
+    config_title: Optional[str]
+    folder_name_lc: str  # game folder basename, lowercase ("" if unknown)
+
+
+_profile_cache: Dict[str, ProfileRecord] = {}
+_profile_cache_lock = threading.Lock()
+
+
+def _load_profile(profile_path: str) -> ProfileRecord:
+    """Read one profile from disk.  Raises on missing/invalid files."""
+    with open(profile_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    game_dir = str(data.get("dir") or "").strip()
+    game_exe = str(data.get("path") or "").strip()
+    if game_dir:
+        folder_name = os.path.basename(os.path.normpath(game_dir))
+    elif game_exe:
+        folder_name = os.path.basename(os.path.dirname(game_exe))
+    else:
+        folder_name = ""
+    return ProfileRecord(
+        profile_path=profile_path,
+        game_dir=game_dir,
+        game_exe=game_exe,
+        process_names=tuple(str(n).lower() for n in data.get("process_name", [])),
+        gameplay_title=data.get("_gameplay_title"),
+        config_title=data.get("_config_title"),
+        folder_name_lc=folder_name.lower(),
+    )
+
+
+def load_profile(profile_path: str) -> ProfileRecord:
+    """Return the parsed profile, reading each file at most once per session.
+
+    Failures are raised and not cached, so a profile fixed mid-session is
+    picked up on the next call.
+    """
+    record = _profile_cache.get(profile_path)
+    if record is None:
+        record = _load_profile(profile_path)
+        with _profile_cache_lock:
+            _profile_cache[profile_path] = record
+    return record
+
+
+def invalidate_profile_cache() -> None:
+    with _profile_cache_lock:
+        _profile_cache.clear()
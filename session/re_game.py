@@ -1,52 +1,101 @@
 """Game process helpers for the RE stack."""
 
-import json
-import os
-from typing import List
+import re
+import threading
+from typing import FrozenSet, List, Optional, Set
 
 try:
     import psutil
 except Exception:
     psutil = None
 
-from session.re_config import GAME_PROFILES
+from session import _win32_procs
+from session.re_config import GAME_PROFILES, load_profile
+
+_WRAPPER_RE = re.compile(r"launchbox_generic_wrapper\.py", re.IGNORECASE)
+
+
+def _cmdline_has_wrapper(cmdline: Optional[List[str]]) -> bool:
+    # The script name has no spaces, so testing each argument matches the old
+    # join-then-lower check without building the joined string.
+    return any(_WRAPPER_RE.search(arg) for arg in cmdline or ())
 
 
 def find_wrapper_pids() -> List[int]:
     if psutil is None:
         return []
     pids: List[int] = []
+    if _win32_procs.available():
+        # Only Python interpreters can be running the wrapper script, so pick
+        # them out of one ToolHelp snapshot and read just their command lines.
+        for pid, name in _win32_procs.iter_process_names():
+            if not name.lower().startswith("py"):
+                continue
+            try:
+                cmdline = psutil.Process(pid).cmdline()
+            except Exception:
+                continue
+            if _cmdline_has_wrapper(cmdline):
+                pids.append(pid)
+        return pids
     for proc in psutil.process_iter(["pid", "name", "cmdline"]):
         try:
-            cmdline = " ".join(proc.info.get("cmdline") or []).lower()
-            if "launchbox_generic_wrapper.py" in cmdline:
+            if _cmdline_has_wrapper(proc.info.get("cmdline")):
                 pids.append(int(proc.info["pid"]))
         except Exception:
             continue
     return pids
 
 
-def re_process_names() -> List[str]:
-    """Return the lowercase process names declared across all loaded game profiles."""
-    names: List[str] = []
+_PROC_NAMES: Optional[FrozenSet[str]] = None
+_PROC_NAMES_LOCK = threading.Lock()
+
+
+def _load_process_names() -> FrozenSet[str]:
+    names: Set[str] = set()
     for profile_path in GAME_PROFILES.values():
         try:
-            with open(profile_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for name in data.get("process_name", []):
-                names.append(str(name).lower())
+            names.update(load_profile(profile_path).process_names)
         except Exception:
             continue
-    return names
+    return frozenset(names)
+
+
+def _known_process_names() -> FrozenSet[str]:
+    """Profile process names, read once per session (the profiles don't change)."""
+    global _PROC_NAMES
+    if _PROC_NAMES is None:
+        with _PROC_NAMES_LOCK:
+            if _PROC_NAMES is None:
+                _PROC_NAMES = _load_process_names()
+    return _PROC_NAMES
+
+
+def _invalidate_process_name_cache() -> None:
+    global _PROC_NAMES
+    with _PROC_NAMES_LOCK:
+        _PROC_NAMES = None
 
 
-def is_re_game_running() -> bool:
+def re_process_names() -> List[str]:
+    """Return the lowercase process names declared across all loaded game profiles."""
+    return list(_known_process_names())
+
+
+def is_re_game_running(known: Optional[FrozenSet[str]] = None) -> bool:
     """Return True if any RE game process from the known profiles is currently running."""
-    if psutil is None:
-        return False
-    known = set(re_process_names())
+    if known is None:
+        known = _known_process_names()
     if not known:
         return False
+    if _win32_procs.available():
+        # One ToolHelp snapshot: names come back in bulk, no per-PID handle.
+        for _pid, name in _win32_procs.iter_process_names():
+            if name.lower() in known:
+                return True
+        return False
+    if psutil is None:
+        return False
     for proc in psutil.process_iter(["name"]):
         try:
             if (proc.info.get("name") or "").lower() in known:
@@ -1,13 +1,15 @@
 """Guided manual Resident Evil stack mode."""
 
-import json
 import os
-import subprocess
 import time
 from typing import Optional, Tuple
 
+import win32api
+import win32con
+import win32gui
+
 from session.audio import set_default_audio_best_effort
-from session.display_api import get_crt_display_rect
+from session.display_api import enumerate_attached_displays, get_crt_display_rect
 from session.moonlight import (
     ensure_moonlight_running,
     find_moonlight_window,
@@ -26,6 +28,7 @@ from session.re_config import (
     RESTORE_AUDIO_DEVICE_TOKEN,
     STOP_FLAG,
     VDD_ATTACH_TIMEOUT_SECONDS,
+    load_profile,
 )
 from session.re_game import is_re_game_running
 from session.re_preflight import (
@@ -34,7 +37,8 @@ from session.re_preflight import (
     open_windows_display_settings,
 )
 from session.vdd import plug_vdd_and_wait
-from session.window_utils import find_window, get_rect, move_window
+from session.win_events import WINDOW_APPEAR_EVENTS, EventWaiter
+from session.window_utils import find_window, find_window_by_priority, get_rect, move_window
 
 
 def _manual_header(title: str) -> None:
@@ -52,46 +56,29 @@ def _manual_note(text: str) -> None:
     print(f"[re-stack][manual] {text}")
 
 
+def _shell_open(path: str) -> bool:
+    """Open path with its shell handler (Explorer for folders); True on success."""
+    try:
+        # Returns an instance handle > 32 on success, raises on failure.
+        return int(win32api.ShellExecute(0, "open", path, None, None, win32con.SW_SHOWNORMAL)) > 32
+    except Exception as e:
+        print(f"[re-stack] ShellExecute failed for '{path}': {e}")
+        return False
+
+
 def _open_re_game_folder(profile_path: str) -> None:
     try:
-        with open(profile_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        target_dir = str(data.get("dir") or "").strip()
-        target_exe = str(data.get("path") or "").strip()
-        if target_dir and os.path.isdir(target_dir):
+        record = load_profile(profile_path)
+        candidates = [record.game_dir]
+        if record.game_exe:
+            candidates.append(os.path.dirname(record.game_exe))
+        for target_dir in candidates:
+            if not target_dir or not os.path.isdir(target_dir):
+                continue
             print(f"[re-stack] Opening RE game folder: {target_dir}")
-            try:
-                if os.name == "nt" and hasattr(os, "startfile"):
-                    os.startfile(target_dir)  # type: ignore[attr-defined]
-                    print(f"[re-stack] Opened RE game folder: {target_dir}")
-                    return
-            except Exception as e:
-                print(f"[re-stack] os.startfile failed for RE folder: {e}")
-            for cmd in (["explorer.exe", target_dir], ["cmd", "/c", "start", "", target_dir]):
-                try:
-                    subprocess.Popen(cmd)
-                    print(f"[re-stack] Opened RE game folder: {target_dir}")
-                    return
-                except Exception:
-                    continue
-        if target_exe:
-            exe_dir = os.path.dirname(target_exe)
-            if exe_dir and os.path.isdir(exe_dir):
-                print(f"[re-stack] Opening RE game folder: {exe_dir}")
-                try:
-                    if os.name == "nt" and hasattr(os, "startfile"):
-                        os.startfile(exe_dir)  # type: ignore[attr-defined]
-                        print(f"[re-stack] Opened RE game folder: {exe_dir}")
-                        return
-                except Exception as e:
-                    print(f"[re-stack] os.startfile failed for RE folder: {e}")
-                for cmd in (["explorer.exe", exe_dir], ["cmd", "/c", "start", "", exe_dir]):
-                    try:
-                        subprocess.Popen(cmd)
-                        print(f"[re-stack] Opened RE game folder: {exe_dir}")
-                        return
-                    except Exception:
-                        continue
+            if _shell_open(target_dir):
+                print(f"[re-stack] Opened RE game folder: {target_dir}")
+                return
         print("[re-stack] Could not open RE game folder (directory not found in profile).")
     except Exception as e:
         print(f"[re-stack] Could not open RE game folder from profile '{profile_path}': {e}")
@@ -99,24 +86,51 @@ def _open_re_game_folder(profile_path: str) -> None:
 
 def _folder_window_title_hint_from_profile(profile_path: str) -> str:
     try:
-        with open(profile_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        target_dir = str(data.get("dir") or "").strip()
-        if target_dir:
-            return os.path.basename(os.path.normpath(target_dir)).lower()
-        target_exe = str(data.get("path") or "").strip()
-        if target_exe:
-            return os.path.basename(os.path.dirname(target_exe)).lower()
+        hint = load_profile(profile_path).folder_name_lc
     except Exception:
-        pass
-    return "resident evil"
+        hint = ""
+    return hint or "resident evil"
+
+
+# Last Explorer window that matched a folder title hint: (title_hint, hwnd).
+_last_re_folder_hwnd: Optional[Tuple[str, int]] = None
+
+
+def _cached_re_folder_window(title_hint: str) -> Optional[int]:
+    if _last_re_folder_hwnd is None or _last_re_folder_hwnd[0] != title_hint:
+        return None
+    hwnd = _last_re_folder_hwnd[1]
+    try:
+        if not win32gui.IsWindow(hwnd) or not win32gui.IsWindowVisible(hwnd):
+            return None
+        if win32gui.IsIconic(hwnd):
+            return None
+        if "cabinetwclass" not in win32gui.GetClassName(hwnd).lower():
+            return None
+        if title_hint not in win32gui.GetWindowText(hwnd).lower():
+            return None
+    except Exception:
+        return None
+    return hwnd
 
 
 def _find_re_folder_window(profile_path: str) -> Optional[int]:
+    global _last_re_folder_hwnd
     title_hint = _folder_window_title_hint_from_profile(profile_path)
-    hwnd = find_window(None, ["cabinetwclass"], [title_hint], match_any_pid=True)
-    if hwnd is None:
-        hwnd = find_window(None, ["cabinetwclass"], [], match_any_pid=True)
+    hwnd = _cached_re_folder_window(title_hint)
+    if hwnd is not None:
+        return hwnd
+    hwnd = find_window_by_priority(
+        None, ["cabinetwclass"], [[title_hint], []], match_any_pid=True
+    )
+    if hwnd is not None:
+        try:
+            # Only cache a title-hint match; the any-Explorer fallback could be
+            # a different folder next time.
+            if title_hint in win32gui.GetWindowText(hwnd).lower():
+                _last_re_folder_hwnd = (title_hint, hwnd)
+        except Exception:
+            pass
     return hwnd
 
 
@@ -171,23 +185,33 @@ def _move_re_folder_window_to_internal(profile_path: str) -> bool:
     w = max(700, min(pref_w, iw - (margin_x * 2)))
     h = max(500, min(pref_h, ih - (margin_y * 2)))
 
-    title_hint = _folder_window_title_hint_from_profile(profile_path)
-    for _ in range(24):
-        hwnd = find_window(None, ["cabinetwclass"], [title_hint], match_any_pid=True)
-        if hwnd is None:
-            hwnd = find_window(None, ["cabinetwclass"], [], match_any_pid=True)
-        if hwnd:
-            try:
-                move_window(hwnd, x, y, w, h, strip_caption=False)
-                print(
-                    "[re-stack] RE folder window moved to Internal Display: "
-                    f"x={x}, y={y}, w={w}, h={h}"
-                )
-                return True
-            except Exception as e:
-                print(f"[re-stack] Failed moving RE folder window to Internal Display: {e}")
-                return False
-        time.sleep(0.25)
+    deadline = time.monotonic() + 6.0
+    # Re-scan only when an Explorer window is shown or renamed, at most every
+    # 0.25 s (the old poll rate); other windows' events don't wake the wait.
+    # Without hooks this falls back to the plain 0.25 s poll.
+    with EventWaiter(
+        min_interval=0.25,
+        hook_ranges=WINDOW_APPEAR_EVENTS,
+        display_changes=False,
+        window_classes=("cabinetwclass",),
+    ) as waiter:
+        while True:
+            hwnd = _find_re_folder_window(profile_path)
+            if hwnd:
+                try:
+                    move_window(hwnd, x, y, w, h, strip_caption=False)
+                    print(
+                        "[re-stack] RE folder window moved to Internal Display: "
+                        f"x={x}, y={y}, w={w}, h={h}"
+                    )
+                    return True
+                except Exception as e:
+                    print(f"[re-stack] Failed moving RE folder window to Internal Display: {e}")
+                    return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            waiter.wait(min(remaining, 1.0 if waiter.active else 0.25))
 
     print("[re-stack] Could not find RE folder Explorer window to move to Internal Display.")
     return False
@@ -243,27 +267,15 @@ def _move_moonlight_back_to_internal_manual(
             "[re-stack] Returning Moonlight to pre-move manual rect: "
             f"x={x}, y={y}, w={w}, h={h}"
         )
-        if move_moonlight_to_internal(
-            REQUIRED_DISPLAY_GROUPS["internal_display"],
-            MOONLIGHT_DIR,
-            idle_rect=restore_rect,
-        ):
-            return True
-        print("[re-stack] Pre-move rect restore failed; trying current internal display layout...")
     else:
         print("[re-stack] Returning Moonlight to Internal Display using current display layout...")
-
-    if move_moonlight_to_internal(
-        REQUIRED_DISPLAY_GROUPS["internal_display"],
-        MOONLIGHT_DIR,
-        idle_rect=None,
-    ):
-        return True
-    print("[re-stack] Live internal display move failed; trying configured idle rect fallback...")
+    # Pre-move rect, then the live internal display layout, then the
+    # configured idle rect; one window/display lookup covers all three.
     return move_moonlight_to_internal(
         REQUIRED_DISPLAY_GROUPS["internal_display"],
         MOONLIGHT_DIR,
-        idle_rect=MOONLIGHT_IDLE_RECT,
+        idle_rect=restore_rect,
+        fallback_rects=(None, MOONLIGHT_IDLE_RECT),
     )
 
 
@@ -325,12 +337,14 @@ def manual_stack(game: str) -> int:
         print()
         input("[re-stack] Press Enter after you have finished the manual display setup steps...")
 
-        count = attached_display_count()
+        # One enumeration after the user's changes serves both checks.
+        displays = enumerate_attached_displays(with_monitors=True)
+        count = attached_display_count(displays)
         print(f"[re-stack] Attached display count after manual setup: {count}")
         if count != 3:
             print("[re-stack] Expected 3 attached displays. Please fix display setup and try again.")
             return 1
-        if not ensure_required_displays(REQUIRED_DISPLAY_GROUPS):
+        if not ensure_required_displays(REQUIRED_DISPLAY_GROUPS, displays):
             print("[re-stack] Required display set not found after manual setup.")
             return 1
 
@@ -364,9 +378,13 @@ def manual_stack(game: str) -> int:
         input("[re-stack] Press Enter after you have launched the game...")
         _manual_note("Waiting for the RE game process to start, then monitoring for exit.")
 
+        # Per-tick callables bound to locals once (see start_stack).
+        clock = time.time
+        sleep = time.sleep
+        game_running = is_re_game_running
         while True:
-            now = time.time()
-            running = is_re_game_running()
+            now = clock()
+            running = game_running()
             if running:
                 if not game_was_running:
                     game_was_running = True
@@ -381,7 +399,7 @@ def manual_stack(game: str) -> int:
             elif now - last_wait_log >= 10.0:
                 print("[re-stack] Waiting for RE game process to start...")
                 last_wait_log = now
-            time.sleep(1.0)
+            sleep(1.0)
 
     except KeyboardInterrupt:
         interrupted = True
@@ -2,20 +2,34 @@
 
 import os
 import subprocess
-from typing import Dict, List
+from typing import List, Mapping, Optional, Sequence
 
 from session.display_api import enumerate_attached_displays, find_display_by_token
 
 
-def ensure_required_displays(required_display_groups: Dict[str, List[str]]) -> bool:
-    attached = enumerate_attached_displays()
-    print(f"[re-stack] Attached display count: {len(attached)}")
+def ensure_required_displays(
+    required_display_groups: Mapping[str, Sequence[str]],
+    displays: Optional[List[dict]] = None,
+) -> bool:
+    """Check every required group resolves to an attached display.
+
+    Pass `displays` (an enumerate_attached_displays(with_monitors=True)
+    snapshot) to reuse an enumeration the caller already made.
+    """
+    if displays is None:
+        displays = enumerate_attached_displays(with_monitors=True)
+    print(f"[re-stack] Attached display count: {len(displays)}")
 
     missing: List[str] = []
     for label, tokens in required_display_groups.items():
-        match = next((find_display_by_token(t) for t in tokens if find_display_by_token(t)), {})
+        match: dict = {}
+        matched_token = ""
+        for t in tokens:
+            match = find_display_by_token(t, displays)
+            if match:
+                matched_token = t
+                break
         if match:
-            matched_token = next(t for t in tokens if find_display_by_token(t))
             print(
                 f"[re-stack] Required display '{label}' matched: "
                 f"{match['device_name']} via token '{matched_token}'"
@@ -32,8 +46,8 @@ def ensure_required_displays(required_display_groups: Dict[str, List[str]]) -> b
     return True
 
 
-def attached_display_count() -> int:
-    return len(enumerate_attached_displays())
+def attached_display_count(displays: Optional[List[dict]] = None) -> int:
+    return len(enumerate_attached_displays() if displays is None else displays)
 
 
 def open_windows_display_settings() -> None:
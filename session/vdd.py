@@ -11,7 +11,12 @@ except Exception:
     win32api = None
     win32con = None
 
-from session.display_api import find_display_by_token
+from session.display_api import find_display_by_token, invalidate_display_cache
+
+# Attach poll backoff: the display often appears within ~100 ms of the
+# re-attach, so start fast and settle at the old 500 ms cadence.
+_ATTACH_POLL_FIRST_DELAY_S = 0.05
+_ATTACH_POLL_MAX_DELAY_S = 0.5
 
 
 def _find_vdd_device_name(token: str) -> Optional[str]:
@@ -80,6 +85,7 @@ def unplug_vdd(moonlight_token: str) -> bool:
             print(f"[re-stack] VDD: unplug failed (code {rc}).")
             return False
         commit_rc = win32api.ChangeDisplaySettingsEx(None, None)
+        invalidate_display_cache()
         if commit_rc != win32con.DISP_CHANGE_SUCCESSFUL:
             print(f"[re-stack] VDD: unplug commit failed (code {commit_rc}).")
             return False
@@ -129,6 +135,7 @@ def plug_vdd_and_wait(moonlight_token: str, timeout_seconds: int = 15) -> bool:
                     win32con.CDS_UPDATEREGISTRY | win32con.CDS_NORESET,
                 )
                 commit_rc = win32api.ChangeDisplaySettingsEx(None, None)
+                invalidate_display_cache()
                 if rc == win32con.DISP_CHANGE_SUCCESSFUL and commit_rc == win32con.DISP_CHANGE_SUCCESSFUL:
                     print(
                         f"[re-stack] VDD: re-attached {dev_name} using "
@@ -145,8 +152,17 @@ def plug_vdd_and_wait(moonlight_token: str, timeout_seconds: int = 15) -> bool:
             )
 
     print(f"[re-stack] VDD: waiting for display to attach (up to {timeout_seconds}s)...")
-    for _ in range(timeout_seconds * 2):
-        time.sleep(0.5)
+    deadline = time.monotonic() + timeout_seconds
+    delay = _ATTACH_POLL_FIRST_DELAY_S
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, _ATTACH_POLL_MAX_DELAY_S)
+        # Waiting on a topology change: bypass the enumeration cache so a
+        # recent negative result can't hide the attach.
+        invalidate_display_cache()
         if find_display_by_token(moonlight_token):
             print("[re-stack] VDD: display attached.")
             return True
@@ -30,13 +30,14 @@ import signal
 import subprocess
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from session.window_utils import (
     find_existing_pids,
     find_window,
     get_rect,
     move_window,
+    move_windows,
 )
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -68,9 +69,10 @@ class _WatchTarget:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _load_target(profile_path: str) -> _WatchTarget:
-    with open(profile_path, "r", encoding="utf-8-sig") as f:
-        p = json.load(f)
+def _load_target(profile_path: str, p: Optional[dict] = None) -> _WatchTarget:
+    if p is None:
+        with open(profile_path, "r", encoding="utf-8-sig") as f:
+            p = json.load(f)
     slug = os.path.splitext(os.path.basename(profile_path))[0]
     return _WatchTarget(
         slug=slug,
@@ -136,20 +138,23 @@ def _soft_stop_targets(
     rx: int, ry: int, rw: int, rh: int,
 ) -> None:
     """Move active emulator windows to the main screen and mark them paused."""
-    moved_any = False
+    found: List[Tuple[_WatchTarget, int]] = []
     for target in targets:
         if target.paused:
             continue
         hwnd = _find_window_for_target(target)
         if hwnd:
-            try:
-                move_window(hwnd, rx, ry, rw, rh)
-                print(f"[watcher] {target.slug}: moved to main screen.")
-                moved_any = True
-            except Exception as exc:
-                print(f"[watcher] {target.slug}: could not move: {exc}")
+            found.append((target, hwnd))
         target.paused = True
         target.last_hwnd = None
+    moved_any = False
+    errors = move_windows([(hwnd, rx, ry, rw, rh) for _, hwnd in found])
+    for (target, _), exc in zip(found, errors):
+        if exc is None:
+            print(f"[watcher] {target.slug}: moved to main screen.")
+            moved_any = True
+        else:
+            print(f"[watcher] {target.slug}: could not move: {exc}")
     if moved_any:
         _write_stop_flag()
 
@@ -159,14 +164,17 @@ def _restore_all_windows(
     rx: int, ry: int, rw: int, rh: int,
 ) -> None:
     """Move all windows (paused or not) to the restore rect on full shutdown."""
+    found: List[Tuple[_WatchTarget, int]] = []
     for target in targets:
         hwnd = _find_window_for_target(target)
         if hwnd:
-            try:
-                move_window(hwnd, rx, ry, rw, rh)
-                print(f"[watcher] {target.slug}: moved to primary rect.")
-            except Exception as exc:
-                print(f"[watcher] {target.slug}: could not restore: {exc}")
+            found.append((target, hwnd))
+    errors = move_windows([(hwnd, rx, ry, rw, rh) for _, hwnd in found])
+    for (target, _), exc in zip(found, errors):
+        if exc is None:
+            print(f"[watcher] {target.slug}: moved to primary rect.")
+        else:
+            print(f"[watcher] {target.slug}: could not restore: {exc}")
 
 
 def _write_stop_flag() -> None:
@@ -206,6 +214,7 @@ def run(
     restore_rect: Tuple[int, int, int, int],
     poll_seconds: float = 0.5,
     debug: bool = False,
+    profile_data: Optional[Dict[str, dict]] = None,
 ) -> None:
     """Run the watcher loop until the primary process exits or full shutdown.
 
@@ -217,6 +226,8 @@ def run(
         restore_rect:          (x, y, w, h) to move windows to on shutdown.
         poll_seconds:          Seconds between poll iterations.
         debug:                 Print detailed window-tracking output.
+        profile_data:          Already-parsed profiles keyed by path (e.g.
+                               from manifest.load); others are read from disk.
     """
     # Clear any stale stop flag from a previous session.
     try:
@@ -226,8 +237,9 @@ def run(
     except Exception:
         pass
 
-    primary = _load_target(primary_profile_path)
-    watch_targets = [_load_target(p) for p in watch_profile_paths]
+    parsed = profile_data or {}
+    primary = _load_target(primary_profile_path, parsed.get(primary_profile_path))
+    watch_targets = [_load_target(p, parsed.get(p)) for p in watch_profile_paths]
 
     rx, ry, rw, rh = restore_rect
 
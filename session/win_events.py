@@ -0,0 +1,352 @@
+"""Event-driven wakeups for the session polling loops.
+
+EventWaiter replaces a fixed time.sleep() between loop iterations with a
+message-pumping wait that returns early when something the loop cares about
+changes: the foreground window, a top-level window being shown or finishing
+a user move/resize, or the display configuration (WM_DISPLAYCHANGE).  Child
+controls are ignored, and wakeups are rate-limited by min_interval.  The
+timeout stays as a ceiling so time-based checks keep running.
+
+WinEvent hooks are installed WINEVENT_OUTOFCONTEXT, so their callbacks run on
+the thread that created the waiter while it pumps messages inside wait().
+Create, wait on and close the waiter from one thread.
+
+WM_DISPLAYCHANGE is only broadcast to top-level windows (message-only
+windows never see broadcasts), so the listener is a hidden, never-shown
+top-level tool window rather than an HWND_MESSAGE child.
+
+On non-Windows platforms, or if setup fails, wait() is a plain sleep.
+"""
+
+import ctypes
+import ctypes.wintypes
+import sys
+import time
+from typing import Tuple
+
+_EVENT_SYSTEM_FOREGROUND = 0x0003
+_EVENT_SYSTEM_MOVESIZEEND = 0x000B
+_EVENT_OBJECT_SHOW = 0x8002
+_EVENT_OBJECT_NAMECHANGE = 0x800C
+_WINEVENT_OUTOFCONTEXT = 0x0000
+_WINEVENT_SKIPOWNPROCESS = 0x0002
+_OBJID_WINDOW = 0
+_CHILDID_SELF = 0
+_GA_ROOT = 2
+
+_WM_DISPLAYCHANGE = 0x007E
+_WS_POPUP = 0x80000000
+_WS_EX_TOOLWINDOW = 0x00000080
+_QS_ALLINPUT = 0x04FF
+_MWMO_INPUTAVAILABLE = 0x0004
+_PM_REMOVE = 0x0001
+
+_CLASS_NAME = "CrtSessionEventWaiter"
+
+# (eventMin, eventMax) ranges hooked by default.  LOCATIONCHANGE/NAMECHANGE
+# are left out: they fire continuously system-wide (scrolling, clocks, tab
+# titles) and would wake the loops far more often than a 1 s poll.
+_HOOK_RANGES = (
+    (_EVENT_SYSTEM_FOREGROUND, _EVENT_SYSTEM_FOREGROUND),
+    (_EVENT_SYSTEM_MOVESIZEEND, _EVENT_SYSTEM_MOVESIZEEND),
+    (_EVENT_OBJECT_SHOW, _EVENT_OBJECT_SHOW),
+)
+
+# Narrower set for waiting on a window to appear: shown, or renamed (Explorer
+# retitles an existing window when it navigates to the requested folder).
+WINDOW_APPEAR_EVENTS = (
+    (_EVENT_OBJECT_SHOW, _EVENT_OBJECT_SHOW),
+    (_EVENT_OBJECT_NAMECHANGE, _EVENT_OBJECT_NAMECHANGE),
+)
+
+if sys.platform == "win32":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _LRESULT = ctypes.wintypes.LPARAM
+    _WINEVENTPROC = ctypes.WINFUNCTYPE(
+        None,
+        ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD, ctypes.wintypes.HWND,
+        ctypes.wintypes.LONG, ctypes.wintypes.LONG,
+        ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+    )
+    _WNDPROC = ctypes.WINFUNCTYPE(
+        _LRESULT,
+        ctypes.wintypes.HWND, ctypes.wintypes.UINT,
+        ctypes.wintypes.WPARAM, ctypes.wintypes.LPARAM,
+    )
+
+    class _WNDCLASSW(ctypes.Structure):
+        _fields_ = [
+            ("style", ctypes.wintypes.UINT),
+            ("lpfnWndProc", _WNDPROC),
+            ("cbClsExtra", ctypes.c_int),
+            ("cbWndExtra", ctypes.c_int),
+            ("hInstance", ctypes.wintypes.HINSTANCE),
+            ("hIcon", ctypes.wintypes.HICON),
+            ("hCursor", ctypes.wintypes.HANDLE),
+            ("hbrBackground", ctypes.wintypes.HBRUSH),
+            ("lpszMenuName", ctypes.wintypes.LPCWSTR),
+            ("lpszClassName", ctypes.wintypes.LPCWSTR),
+        ]
+
+    _user32.SetWinEventHook.argtypes = [
+        ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.HMODULE,
+        _WINEVENTPROC, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+    ]
+    _user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+    _user32.GetAncestor.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.UINT]
+    _user32.GetAncestor.restype = ctypes.wintypes.HWND
+    _user32.GetClassNameW.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.LPWSTR, ctypes.c_int]
+    _user32.GetClassNameW.restype = ctypes.c_int
+    _user32.UnhookWinEvent.argtypes = [ctypes.wintypes.HANDLE]
+    _user32.UnhookWinEvent.restype = ctypes.wintypes.BOOL
+
+    _user32.DefWindowProcW.argtypes = [
+        ctypes.wintypes.HWND, ctypes.wintypes.UINT,
+        ctypes.wintypes.WPARAM, ctypes.wintypes.LPARAM,
+    ]
+    _user32.DefWindowProcW.restype = _LRESULT
+    _user32.RegisterClassW.argtypes = [ctypes.POINTER(_WNDCLASSW)]
+    _user32.RegisterClassW.restype = ctypes.wintypes.ATOM
+    _user32.UnregisterClassW.argtypes = [ctypes.wintypes.LPCWSTR, ctypes.wintypes.HINSTANCE]
+    _user32.UnregisterClassW.restype = ctypes.wintypes.BOOL
+    _user32.CreateWindowExW.argtypes = [
+        ctypes.wintypes.DWORD, ctypes.wintypes.LPCWSTR, ctypes.wintypes.LPCWSTR,
+        ctypes.wintypes.DWORD, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.wintypes.HWND, ctypes.wintypes.HMENU, ctypes.wintypes.HINSTANCE,
+        ctypes.wintypes.LPVOID,
+    ]
+    _user32.CreateWindowExW.restype = ctypes.wintypes.HWND
+    _user32.DestroyWindow.argtypes = [ctypes.wintypes.HWND]
+    _user32.DestroyWindow.restype = ctypes.wintypes.BOOL
+
+    _user32.MsgWaitForMultipleObjectsEx.argtypes = [
+        ctypes.wintypes.DWORD, ctypes.c_void_p, ctypes.wintypes.DWORD,
+        ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+    ]
+    _user32.MsgWaitForMultipleObjectsEx.restype = ctypes.wintypes.DWORD
+    _user32.PeekMessageW.argtypes = [
+        ctypes.POINTER(ctypes.wintypes.MSG), ctypes.wintypes.HWND,
+        ctypes.wintypes.UINT, ctypes.wintypes.UINT, ctypes.wintypes.UINT,
+    ]
+    _user32.PeekMessageW.restype = ctypes.wintypes.BOOL
+    _user32.TranslateMessage.argtypes = [ctypes.POINTER(ctypes.wintypes.MSG)]
+    _user32.DispatchMessageW.argtypes = [ctypes.POINTER(ctypes.wintypes.MSG)]
+    _user32.DispatchMessageW.restype = _LRESULT
+
+    _kernel32.GetModuleHandleW.argtypes = [ctypes.wintypes.LPCWSTR]
+    _kernel32.GetModuleHandleW.restype = ctypes.wintypes.HMODULE
+else:
+    _user32 = None
+
+
+def available() -> bool:
+    return _user32 is not None
+
+
+class EventWaiter:
+    """Sleep until a relevant window/display event or a timeout, whichever is first.
+
+    Usage:
+        with EventWaiter() as waiter:
+            while ...:
+                ...
+                waiter.wait(1.0)
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        hook_ranges: Tuple[Tuple[int, int], ...] = _HOOK_RANGES,
+        display_changes: bool = True,
+        window_classes: Tuple[str, ...] = (),
+    ):
+        # Event-driven wakeups are rate-limited to one per min_interval so a
+        # burst of window events can't spin the loop.
+        self._min_interval = float(min_interval)
+        self._hook_ranges = tuple(hook_ranges)
+        # If set, only events from top-level windows whose class name contains
+        # one of these (case-insensitive) wake the waiter.
+        self._window_classes = tuple(c.lower() for c in window_classes)
+        self._want_display_window = bool(display_changes)
+        self._fired = False
+        self._display_changed = False
+        self._last_display_change = 0.0
+        self._last_wake = 0.0
+        self._hooks = []
+        self._hwnd = None
+        self._hinstance = None
+        self._class_registered = False
+        self._event_proc = None
+        self._wnd_proc = None
+        self._active = False
+
+    def __enter__(self) -> "EventWaiter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> bool:
+        """Install hooks and the display-change window. Returns False if unavailable."""
+        if _user32 is None or self._active:
+            return self._active
+        try:
+            self._event_proc = _WINEVENTPROC(self._on_win_event)
+            for lo, hi in self._hook_ranges:
+                hook = _user32.SetWinEventHook(
+                    lo, hi, None, self._event_proc, 0, 0,
+                    _WINEVENT_OUTOFCONTEXT | _WINEVENT_SKIPOWNPROCESS,
+                )
+                if hook:
+                    self._hooks.append(hook)
+            if self._want_display_window:
+                self._create_display_window()
+        except Exception as exc:
+            print(f"[re-stack] Window event hooks unavailable ({exc}); using timed polling.")
+            self.close()
+            return False
+        self._active = bool(self._hooks or self._hwnd)
+        return self._active
+
+    def _create_display_window(self) -> None:
+        self._hinstance = _kernel32.GetModuleHandleW(None)
+        self._wnd_proc = _WNDPROC(self._on_window_message)
+        wc = _WNDCLASSW()
+        wc.lpfnWndProc = self._wnd_proc
+        wc.hInstance = self._hinstance
+        wc.lpszClassName = _CLASS_NAME
+        if not _user32.RegisterClassW(ctypes.byref(wc)):
+            return
+        self._class_registered = True
+        # Never shown; WS_EX_TOOLWINDOW keeps it off the taskbar/Alt+Tab.
+        self._hwnd = _user32.CreateWindowExW(
+            _WS_EX_TOOLWINDOW, _CLASS_NAME, "", _WS_POPUP,
+            0, 0, 0, 0, None, None, self._hinstance, None,
+        ) or None
+
+    def _on_win_event(self, _hook, _event, hwnd, id_object, id_child, _thread, _time) -> None:
+        # Only whole top-level windows; OBJID_WINDOW events also fire for
+        # every child control.
+        if not hwnd or id_object != _OBJID_WINDOW or id_child != _CHILDID_SELF:
+            return
+        if _user32.GetAncestor(hwnd, _GA_ROOT) != hwnd:
+            return
+        if self._window_classes:
+            buf = ctypes.create_unicode_buffer(256)
+            if not _user32.GetClassNameW(hwnd, buf, 256):
+                return
+            cls = buf.value.lower()
+            if not any(c in cls for c in self._window_classes):
+                return
+        self._fired = True
+
+    def _on_window_message(self, hwnd, msg, wparam, lparam):
+        if msg == _WM_DISPLAYCHANGE:
+            self._fired = True
+            self._display_changed = True
+            self._last_display_change = time.monotonic()
+        return _user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def watches_display_changes(self) -> bool:
+        """True if WM_DISPLAYCHANGE is being received (the listener window exists)."""
+        return self._active and self._hwnd is not None
+
+    def consume_display_change(self) -> bool:
+        """Return True once per WM_DISPLAYCHANGE received since the last call."""
+        changed = self._display_changed
+        self._display_changed = False
+        return changed
+
+    def _pump(self) -> None:
+        msg = ctypes.wintypes.MSG()
+        while _user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, _PM_REMOVE):
+            _user32.TranslateMessage(ctypes.byref(msg))
+            _user32.DispatchMessageW(ctypes.byref(msg))
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to timeout seconds; return True if woken early by an event."""
+        if not self._active:
+            time.sleep(max(0.0, timeout))
+            return False
+        deadline = time.monotonic() + max(0.0, timeout)
+        earliest = self._last_wake + self._min_interval
+        while True:
+            self._pump()
+            now = time.monotonic()
+            if self._fired and now >= earliest:
+                self._fired = False
+                self._last_wake = now
+                return True
+            if now >= deadline:
+                self._last_wake = now
+                return False
+            until = min(deadline, earliest) if self._fired else deadline
+            ms = max(1, int((until - now) * 1000 + 0.999))
+            _user32.MsgWaitForMultipleObjectsEx(0, None, ms, _QS_ALLINPUT, _MWMO_INPUTAVAILABLE)
+
+    def wait_for_display_change(self, timeout: float) -> bool:
+        """Block until a WM_DISPLAYCHANGE arrives or timeout seconds pass.
+
+        Returns True (consuming the change) if one arrived.  Call
+        consume_display_change() first to drop changes from before the wait.
+        Without a listener this is a plain sleep of `timeout`.
+        """
+        if not self.watches_display_changes():
+            time.sleep(max(0.0, timeout))
+            return False
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            self._pump()
+            if self.consume_display_change():
+                return True
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            ms = max(1, int((deadline - now) * 1000 + 0.999))
+            _user32.MsgWaitForMultipleObjectsEx(0, None, ms, _QS_ALLINPUT, _MWMO_INPUTAVAILABLE)
+
+    def wait_for_display_settle(self, since: float, timeout: float, quiet: float = 0.25) -> bool:
+        """Wait until the display topology has changed after `since` and gone quiet.
+
+        `since` is a time.monotonic() taken before the caller changed the
+        topology.  Returns True once a WM_DISPLAYCHANGE newer than `since` has
+        been followed by `quiet` seconds without another one, or False at the
+        timeout.  Without a listener this is a plain sleep of `timeout`.
+        Pending display-change state is left for consume_display_change().
+        """
+        if not self.watches_display_changes():
+            time.sleep(max(0.0, timeout))
+            return False
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            self._pump()
+            now = time.monotonic()
+            changed_at = self._last_display_change
+            if changed_at >= since and now - changed_at >= quiet:
+                return True
+            if now >= deadline:
+                return False
+            until = min(deadline, changed_at + quiet) if changed_at >= since else deadline
+            ms = max(1, int((until - now) * 1000 + 0.999))
+            _user32.MsgWaitForMultipleObjectsEx(0, None, ms, _QS_ALLINPUT, _MWMO_INPUTAVAILABLE)
+
+    def close(self) -> None:
+        if _user32 is None:
+            return
+        for hook in self._hooks:
+            _user32.UnhookWinEvent(hook)
+        self._hooks = []
+        if self._hwnd:
+            _user32.DestroyWindow(self._hwnd)
+            self._hwnd = None
+        if self._class_registered:
+            _user32.UnregisterClassW(_CLASS_NAME, self._hinstance)
+            self._class_registered = False
+        self._active = False
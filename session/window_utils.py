@@ -1,6 +1,6 @@
 """Shared Win32 window helpers used across session launchers."""
 import time
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import win32con
 import win32gui
@@ -87,10 +87,30 @@ def find_window(
 
     Returns the HWND of the best match, or None.
     """
+    return find_window_by_priority(
+        pid, class_contains, [title_contains], match_any_pid, include_iconic
+    )
+
+
+def find_window_by_priority(
+    pid: Optional[int],
+    class_contains: List[str],
+    title_priority: List[List[str]],
+    match_any_pid: bool = False,
+    include_iconic: bool = False,
+) -> Optional[int]:
+    """Like find_window, but tries several title filters in one EnumWindows pass.
+
+    title_priority is a list of title filter lists, most preferred first (an
+    empty list matches any title).  Returns the largest window of the first
+    tier that has any match — the same result as calling find_window once per
+    tier until one hits, without re-enumerating windows for each tier.
+    """
     pids = pids_for_root(pid) if (pid is not None and not match_any_pid) else None
     class_filters = [x.lower() for x in class_contains if x]
-    title_filters = [x.lower() for x in title_contains if x]
-    best, best_area = None, -1
+    tiers = [[x.lower() for x in titles if x] for titles in title_priority]
+    best: List[Optional[int]] = [None] * len(tiers)
+    best_area: List[int] = [-1] * len(tiers)
     for hwnd in enum_windows():
         try:
             if not win32gui.IsWindowVisible(hwnd):
@@ -102,18 +122,68 @@ def find_window(
                 if win_pid not in pids:
                     continue
             cls = win32gui.GetClassName(hwnd).lower()
-            title = win32gui.GetWindowText(hwnd).lower()
             if class_filters and not any(f in cls for f in class_filters):
                 continue
+            title = win32gui.GetWindowText(hwnd).lower()
+            area = -1
+            for i, title_filters in enumerate(tiers):
+                if title_filters and not any(f in title for f in title_filters):
+                    continue
+                if area < 0:
+                    l, t, w, h = get_rect(hwnd)
+                    area = w * h
+                if area > best_area[i]:
+                    best[i], best_area[i] = hwnd, area
+        except Exception:
+            continue
+    for hwnd in best:
+        if hwnd is not None:
+            return hwnd
+    return None
+
+
+def find_windows_for_pids(
+    root_pids: List[int],
+    title_contains: List[str],
+    include_iconic: bool = False,
+) -> Dict[int, List[Tuple[int, str, int, bool]]]:
+    """Collect visible windows for several process trees in one EnumWindows pass.
+
+    Each root PID covers its descendants, as in find_window.  Returns
+    {root_pid: [(hwnd, title_lower, area, iconic), ...]} sorted largest
+    first, so callers can apply their own preference order (e.g. a title
+    match before any window) without walking the window list again.  A
+    window whose PID sits in several trees goes to the first root given.
+    """
+    owner: Dict[int, int] = {}
+    for root in root_pids:
+        for pid in pids_for_root(root):
+            owner.setdefault(pid, root)
+    title_filters = [x.lower() for x in title_contains if x]
+    found: Dict[int, List[Tuple[int, str, int, bool]]] = {root: [] for root in root_pids}
+    if not owner:
+        return found
+    for hwnd in enum_windows():
+        try:
+            if not win32gui.IsWindowVisible(hwnd):
+                continue
+            iconic = bool(win32gui.IsIconic(hwnd))
+            if iconic and not include_iconic:
+                continue
+            _, win_pid = win32process.GetWindowThreadProcessId(hwnd)
+            root = owner.get(win_pid)
+            if root is None:
+                continue
+            title = win32gui.GetWindowText(hwnd).lower()
             if title_filters and not any(f in title for f in title_filters):
                 continue
             l, t, w, h = get_rect(hwnd)
-            area = w * h
-            if area > best_area:
-                best, best_area = hwnd, area
+            found[root].append((hwnd, title, w * h, iconic))
         except Exception:
             continue
-    return best
+    for windows in found.values():
+        windows.sort(key=lambda item: item[2], reverse=True)
+    return found
 
 
 def is_window_fullscreen(hwnd: int) -> bool:
@@ -141,14 +211,7 @@ def is_window_fullscreen(hwnd: int) -> bool:
     return False
 
 
-def move_window(
-    hwnd: int, x: int, y: int, w: int, h: int, strip_caption: bool = False
-) -> None:
-    """Move and resize a window.  Restores maximised windows first.
-
-    If strip_caption is True, removes WS_CAPTION from the window style before
-    repositioning so the frame does not consume space inside the given rect.
-    """
+def _prepare_for_move(hwnd: int, strip_caption: bool) -> None:
     try:
         if win32gui.IsIconic(hwnd):
             # Minimized (taskbar) — restore before repositioning.
@@ -165,5 +228,48 @@ def move_window(
                 win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, style & ~win32con.WS_CAPTION)
         except Exception:
             pass
+
+
+def move_window(
+    hwnd: int, x: int, y: int, w: int, h: int, strip_caption: bool = False
+) -> None:
+    """Move and resize a window.  Restores maximised windows first.
+
+    If strip_caption is True, removes WS_CAPTION from the window style before
+    repositioning so the frame does not consume space inside the given rect.
+    """
+    _prepare_for_move(hwnd, strip_caption)
     flags = win32con.SWP_SHOWWINDOW | win32con.SWP_FRAMECHANGED
     win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, x, y, w, h, flags)
+
+
+def move_windows(moves: List[Tuple[int, int, int, int, int]]) -> List[Optional[Exception]]:
+    """Move several windows as one deferred SetWindowPos transaction.
+
+    moves is a list of (hwnd, x, y, w, h).  The windows are repositioned
+    together in a single BeginDeferWindowPos/EndDeferWindowPos batch, so the
+    desktop is recomposed once rather than once per window.  If the batch
+    can't be built or committed, each window falls back to move_window().
+
+    Returns one entry per move: None on success, else the exception raised.
+    """
+    results: List[Optional[Exception]] = [None] * len(moves)
+    if not moves:
+        return results
+    for hwnd, _, _, _, _ in moves:
+        _prepare_for_move(hwnd, False)
+    flags = win32con.SWP_SHOWWINDOW | win32con.SWP_FRAMECHANGED
+    try:
+        hdwp = win32gui.BeginDeferWindowPos(len(moves))
+        for hwnd, x, y, w, h in moves:
+            hdwp = win32gui.DeferWindowPos(hdwp, hwnd, win32con.HWND_TOP, x, y, w, h, flags)
+        win32gui.EndDeferWindowPos(hdwp)
+        return results
+    except Exception:
+        pass
+    for i, (hwnd, x, y, w, h) in enumerate(moves):
+        try:
+            win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, x, y, w, h, flags)
+        except Exception as exc:
+            results[i] = exc
+    return results
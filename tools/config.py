@@ -52,14 +52,14 @@ def config_dump() -> Dict[str, Any]:
             "crt_token": CRT_DISPLAY_TOKEN,
             "crt_target_refresh_hz": CRT_TARGET_REFRESH_HZ,
             "restore_primary_token": RESTORE_PRIMARY_DISPLAY_TOKEN,
-            "required_groups": REQUIRED_DISPLAY_GROUPS,
+            "required_groups": {k: list(v) for k, v in REQUIRED_DISPLAY_GROUPS.items()},
         },
         "audio": {
             "re_device_token": RE_AUDIO_DEVICE_TOKEN,
             "restore_device_token": RESTORE_AUDIO_DEVICE_TOKEN,
             "backend": audio_tool_status(),
         },
-        "game_profiles": GAME_PROFILES,
+        "game_profiles": dict(GAME_PROFILES),
         "raw": raw,
     }
 
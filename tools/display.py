@@ -32,7 +32,7 @@ from session.re_config import (
 # ---------------------------------------------------------------------------
 
 def display_dump() -> Dict[str, Any]:
-    displays = enumerate_attached_displays()
+    displays = enumerate_attached_displays(with_monitors=True)
     primary = current_primary_display()
     primary_name = str(primary.get("device_name", "")).lower()
     rational_map = get_rational_refresh_map()
@@ -141,7 +141,7 @@ def display_modes(display_token: Optional[str] = None) -> Dict[str, Any]:
             return {"error": f"no display matches token: {display_token!r}", "displays": []}
         targets = [d]
     else:
-        targets = enumerate_attached_displays()
+        targets = enumerate_attached_displays(with_monitors=True)
 
     result: List[Dict[str, Any]] = []
     for d in targets:
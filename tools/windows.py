@@ -46,7 +46,7 @@ def _all_display_rects() -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     if win32api is None or win32con is None:
         return rows
-    for d in enumerate_attached_displays():
+    for d in enumerate_attached_displays(with_monitors=True):
         try:
             dm = win32api.EnumDisplaySettings(d["device_name"], win32con.ENUM_CURRENT_SETTINGS)
             x, y = d.get("position", (0, 0))